@@ -0,0 +1,55 @@
+"""
+imdb_report: soluzione condivisa dei task dell'esercizio IMDb (traccia.txt).
+
+Uso da riga di comando (dalla cartella ESERCIZIO-001):
+    python -m imdb_report imdb_movies_2024.csv
+    python -m imdb_report --menu imdb_movies_2024.csv
+
+Il pacchetto importa all'avvio solo i moduli a libreria standard; le parti
+che usano pandas, NumPy o matplotlib vengono importate al primo accesso
+(`imdb_report.load_movies`, `imdb_report.FilmStore`, ...), così un comando
+che non le usa non ne paga il costo di import.
+"""
+from importlib import import_module
+
+from .stream import (
+    Movie,
+    Report,
+    TitleSortReport,
+    LongMovieCount,
+    MpaTable,
+    HighRatingReport,
+    default_reports,
+    iter_movies,
+    run_reports,
+)
+from .topk import TopRatedReport, top_rated_stream
+
+# nome esportato -> modulo che lo definisce (importato al primo accesso)
+_LAZY_EXPORTS = {
+    "load_columns": ".cache",
+    "load_movies": ".cache",
+    "FilmStore": ".films",
+    "impute_means": ".impute",
+    "Movies": ".query",
+    "MovieStore": ".store",
+    "run_sharded": ".sharded",
+    "run_chunked": ".chunked",
+    "sort_titles": ".extsort",
+    "write_tables": ".writer",
+    "report_tables": ".writer",
+    "plot_rating_distribution": ".plotting",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
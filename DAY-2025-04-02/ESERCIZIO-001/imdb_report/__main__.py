@@ -0,0 +1,101 @@
+"""
+Esegue i quattro task della traccia con una sola lettura del CSV.
+
+    python -m imdb_report [file.csv]
+    python -m imdb_report --menu [file.csv]
+
+Con `--menu` viene mostrato un menu interattivo: il CSV viene letto solo
+alla prima scelta che ne ha bisogno (una volta sola) e le librerie pesanti
+(matplotlib per il grafico) vengono importate solo dalla voce che le usa.
+"""
+import sys
+
+from .stream import default_reports, run_reports
+from .titles import sorted_titles
+
+DEFAULT_FILE = "imdb_movies_2024.csv"
+
+
+def print_titles(reports, file_path):
+    print("\nLista dei film ordinata per titolo:")
+    # ordine dall'indice <file>.titles.idx: nessun ordinamento se è aggiornato
+    for title in sorted_titles(file_path, reports["titles"].titles):
+        print(title)
+
+
+def print_long_movies(reports):
+    print(f"\nFilm con durata >= 2h: {reports['long_movies'].result()}")
+
+
+def print_mpa(reports):
+    print("\nTotale film per MPA:")
+    for mpa, count in reports["mpa"].result():
+        print(f"{mpa:<12}{count:>6}")
+
+
+def print_high_rating(reports):
+    print("\nFilm con rating superiore a 7.5:")
+    for movie in reports["high_rating"].result():
+        print(f"{movie.rating:>4}  {movie.title}")
+
+
+def main(file_path=DEFAULT_FILE):
+    reports = default_reports()
+    rows = run_reports(file_path, reports.values())
+    print(f"Righe lette: {rows}")
+
+    print_titles(reports, file_path)
+    print_long_movies(reports)
+    print_mpa(reports)
+    print_high_rating(reports)
+
+
+def menu(file_path=DEFAULT_FILE, read=input):
+    loaded = {}
+
+    def reports():
+        # lettura del CSV alla prima richiesta, poi riuso
+        if not loaded:
+            loaded.update(default_reports())
+            run_reports(file_path, loaded.values())
+        return loaded
+
+    def plot():
+        try:
+            from .plotting import plot_rating_distribution
+
+            output = plot_rating_distribution(file_path, "rating_distribution.png")
+        except ImportError as e:
+            # matplotlib è opzionale: il resto del menu continua a funzionare
+            print(f"\nGrafico non disponibile: {e} (pip install matplotlib)")
+            return
+        print(f"\nGrafico salvato in {output}")
+
+    choices = {
+        "1": ("Lista dei film ordinata per titolo", lambda: print_titles(reports(), file_path)),
+        "2": ("Numero di film con durata >= 2h", lambda: print_long_movies(reports())),
+        "3": ("Totale film per MPA", lambda: print_mpa(reports())),
+        "4": ("Film con rating superiore a 7.5", lambda: print_high_rating(reports())),
+        "5": ("Grafico della distribuzione dei rating", plot),
+    }
+
+    while True:
+        print()
+        for key, (label, _) in choices.items():
+            print(f"{key}. {label}")
+        print("0. Esci")
+        choice = read("Scelta: ").strip()
+        if choice == "0":
+            return
+        if choice in choices:
+            choices[choice][1]()
+        else:
+            print("Scelta non valida")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args[:1] == ["--menu"]:
+        menu(*args[1:2])
+    else:
+        main(*args[:1])
@@ -0,0 +1,114 @@
+"""
+Riconoscimento dei campi "scivolati" a sinistra nel CSV IMDb.
+
+Quando in una riga manca un campo, i valori successivi si spostano a
+sinistra: ad esempio "Fighting Spirit" ha "PG-13" nella colonna Duration e
+la colonna MPA vuota. Ogni valore viene classificato in base al suo
+contenuto (anno, durata, MPA, rating, voti) e ricollocato nella colonna
+corretta mantenendo l'ordine originale.
+
+Questo modulo non usa pandas: la versione vettoriale è in `repair.py`.
+"""
+import re
+from functools import lru_cache
+
+# Colonne che possono scivolare, nell'ordine in cui compaiono nel CSV
+FIELDS = ("Year", "Duration", "MPA", "Rating", "Votes")
+
+# Un bit per tipo di valore: un valore può essere compatibile con più tipi
+# (es. "2024" può essere un anno oppure un numero di voti)
+YEAR, DURATION, MPA, RATING, VOTES = 1, 2, 4, 8, 16
+SLOT_BITS = (YEAR, DURATION, MPA, RATING, VOTES)
+
+# Espressioni regolari per i tipi "numerici"; tutto il resto è MPA
+PATTERNS = {
+    YEAR: r"^(?:18|19|20)\d{2}$",
+    DURATION: r"^(?:\d+h(?:\s*\d+m)?|\d+m)$",
+    RATING: r"^(?:10(?:\.0)?|\d\.\d)$",
+    VOTES: r"^\d[\d,]*(?:\.\d+)?[KMB]?$",
+}
+
+_COMPILED = {bit: re.compile(pattern) for bit, pattern in PATTERNS.items()}
+
+
+def field_mask(text):
+    """
+    Classifica un valore restituendo la maschera dei tipi compatibili.
+
+    Args:
+        text (str): valore del campo
+
+    Returns:
+        int: OR dei bit YEAR/DURATION/MPA/RATING/VOTES, 0 se il campo è vuoto
+    """
+    text = text.strip()
+    if not text:
+        return 0
+    mask = 0
+    for bit, pattern in _COMPILED.items():
+        if pattern.match(text):
+            mask |= bit
+    return mask or MPA
+
+
+def is_aligned(masks):
+    """
+    Vero se ogni valore è vuoto o compatibile con la propria colonna.
+
+    Args:
+        masks (Sequence[int]): maschere dei campi, nell'ordine di FIELDS
+    """
+    return all(mask == 0 or mask & slot for mask, slot in zip(masks, SLOT_BITS))
+
+
+@lru_cache(maxsize=None)
+def slot_mapping(masks):
+    """
+    Calcola dove spostare i valori di una riga con una data "firma".
+
+    I valori non vuoti vengono assegnati, nell'ordine, alla prima colonna
+    successiva compatibile. Il risultato dipende solo dalle maschere, quindi
+    viene calcolato una volta per ogni firma distinta.
+
+    Args:
+        masks (tuple[int, ...]): maschere dei campi, nell'ordine di FIELDS
+
+    Returns:
+        tuple[tuple[int, int], ...] | None: coppie (origine, destinazione),
+        None se la riga non è riallineabile
+    """
+    mapping = []
+    slot = 0
+    for source, mask in enumerate(masks):
+        if mask == 0:
+            continue
+        while slot < len(SLOT_BITS) and not mask & SLOT_BITS[slot]:
+            slot += 1
+        if slot == len(SLOT_BITS):
+            return None
+        mapping.append((source, slot))
+        slot += 1
+    return tuple(mapping)
+
+
+def realign_fields(values):
+    """
+    Riallinea i campi di una singola riga.
+
+    Args:
+        values (Sequence[str]): valori nell'ordine di FIELDS
+
+    Returns:
+        list[str]: valori ricollocati nelle colonne corrette (invariati se la
+        riga è già allineata o non è riallineabile)
+    """
+    masks = tuple(field_mask(value) for value in values)
+    if is_aligned(masks):
+        return list(values)
+    mapping = slot_mapping(masks)
+    if mapping is None:
+        return list(values)
+    fixed = [""] * len(FIELDS)
+    for source, target in mapping:
+        fixed[target] = values[source]
+    return fixed
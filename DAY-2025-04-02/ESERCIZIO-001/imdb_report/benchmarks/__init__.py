@@ -0,0 +1,6 @@
+"""
+Benchmark del pacchetto imdb_report.
+
+Ogni modulo si esegue da solo dalla cartella ESERCIZIO-001, ad esempio:
+    python -m imdb_report.benchmarks.duration --rows 10000000
+"""
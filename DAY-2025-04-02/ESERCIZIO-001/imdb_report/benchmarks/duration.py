@@ -0,0 +1,78 @@
+"""
+Confronto tra il parsing della durata riga per riga (`apply` + `re.match`,
+come nelle soluzioni degli studenti) e `parse_duration_column`.
+
+    python -m imdb_report.benchmarks.duration --rows 10000000
+"""
+import argparse
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from ..columns import INVALID_MINUTES, parse_duration_column
+
+
+def duration_to_minutes(duration):
+    # versione di riferimento (Ivan Scandura / Rosario Mirabella)
+    match = re.match(r'(?:(\d+)h\s*)?(?:(\d+)m)?', str(duration))
+    if match:
+        hours = int(match.group(1)) if match.group(1) else 0
+        minutes = int(match.group(2)) if match.group(2) else 0
+        return hours * 60 + minutes
+    return None
+
+
+def synthetic_durations(rows, seed=0):
+    """
+    Genera una colonna di durate nei formati presenti nel CSV.
+
+    Args:
+        rows (int): numero di righe
+        seed (int): seme del generatore casuale
+
+    Returns:
+        pandas.Series: colonna di stringhe ("1h 36m", "2h", "55m", "")
+    """
+    rng = np.random.default_rng(seed)
+    hours = pd.Series(rng.integers(0, 4, rows)).astype(str)
+    minutes = pd.Series(rng.integers(1, 60, rows)).astype(str)
+    kind = rng.integers(0, 20, rows)
+
+    column = hours + "h " + minutes + "m"
+    column = column.mask(kind == 0, hours + "h")
+    column = column.mask(kind == 1, minutes + "m")
+    column = column.mask(kind == 2, "")
+    return column
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}{elapsed:>10.3f} s")
+    return result, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    args = parser.parse_args(argv)
+
+    column = synthetic_durations(args.rows)
+    print(f"Righe: {args.rows:,}")
+
+    baseline, t_apply = timed("apply + re.match", column.apply, duration_to_minutes)
+    vectorized, t_vector = timed("parse_duration_column", parse_duration_column, column)
+
+    # stesso risultato: le stringhe vuote per il vecchio parser valgono 0
+    expected = baseline.fillna(0).to_numpy()
+    actual = np.where(vectorized == INVALID_MINUTES, 0, vectorized)
+    assert (expected == actual).all(), "i due parser non coincidono"
+
+    print(f"Speedup: {t_apply / t_vector:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""
+Confronto di tutte le soluzioni dell'esercizio IMDb su CSV sintetici.
+
+Per ogni soluzione e per ogni dimensione (default 1K, 100K, 10M righe):
+- si genera un CSV sintetico con lo stesso formato di imdb_movies_2024.csv;
+- si esegue la soluzione in un processo separato, in una cartella di lavoro
+  dove il CSV ha il nome che lo script si aspetta;
+- si misurano tempo (wall clock) e picco di memoria (RSS massimo) per task,
+  oppure per l'intero script se non espone funzioni separate;
+- le librerie pesanti importate dallo script (pandas, numpy, matplotlib) e
+  il modulo con le funzioni vengono caricati prima di far partire il
+  cronometro, per tutti i tipi di target: il loro costo è riportato a
+  parte nella colonna "import".
+
+Alla fine viene stampata (e opzionalmente salvata) una tabella Markdown.
+
+    python -m imdb_report.benchmarks.implementations --sizes 1000,100000 --output risultati.md
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from typing import NamedTuple
+
+from ..parsing import COLUMNS
+
+# cartella ESERCIZIO-001 (contiene le soluzioni e il pacchetto imdb_report)
+EXERCISE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DATA_NAME = "imdb_movies_2024.csv"
+DEFAULT_SIZES = (1_000, 100_000, 10_000_000)
+
+_MPA_VALUES = ("", "", "R", "R", "PG-13", "PG", "TV-MA", "Not Rated", "TV-14", "TV-PG", "Unrated", "G")
+_WORDS = ("Inside", "Out", "Deadpool", "Wolverine", "The", "Dune", "Part", "Two", "Wicked",
+          "Moana", "Night", "Last", "Dance", "Kingdom", "Planet", "Apes", "Love", "Story")
+
+
+class Task(NamedTuple):
+    name: str
+    # "percorso/script.py" (intero script), "percorso/script.py::funzione"
+    # oppure "pacchetto.modulo:funzione"
+    target: str
+    args: tuple = ()
+
+
+class Implementation(NamedTuple):
+    name: str
+    tasks: tuple
+    # percorso (relativo alla cartella di lavoro) in cui lo script cerca il CSV
+    data_name: str = DATA_NAME
+    # testo inviato sullo standard input (per i programmi con menù)
+    stdin: str = ""
+
+
+def _script(folder, file_name):
+    return os.path.join(EXERCISE_DIR, folder, file_name)
+
+
+IMPLEMENTATIONS = (
+    Implementation("imdb_report (streaming)", (Task("all", "imdb_report.benchmarks.implementations:run_stream"),)),
+    Implementation("imdb_report (sharded)", (Task("all", "imdb_report.benchmarks.implementations:run_sharded"),)),
+    Implementation("Stefano Cammarata (pandas)", (
+        Task("titles", _script("Stefano Cammarata/Movies", "film_filter.py") + "::ordina_per_titoli"),
+        Task("long", _script("Stefano Cammarata/Movies", "film_filter.py") + "::filtra_film_lunghi"),
+        Task("mpa", _script("Stefano Cammarata/Movies", "film_filter.py") + "::conta_film_per_mpa"),
+        Task("rating", _script("Stefano Cammarata/Movies", "film_filter.py") + "::best_films", (7.5,)),
+    )),
+    Implementation("Salvatore Viganò (pandas)", (
+        Task("all", _script("Salvatore Viganò/esercizio001", "esercizio001.py") + "::main"),
+    )),
+    Implementation("Gianluca Daidone (csv.DictReader)", (Task("all", _script("Gianluca Daidone", "Main.py")),)),
+    Implementation("Agostino Isgrò (Film + iterrows)", (Task("all", _script("Agostino Isgrò", "main.py")),)),
+    Implementation("Claudio Artale", (Task("all", _script("Claudio Artale", "movies.py")),)),
+    Implementation("Claudio Caudullo (menu)", (Task("all", _script("Claudio Caudullo", "main.py")),), stdin="0\n"),
+    Implementation("Damiano Di Paola", (Task("all", _script("Damiano Di Paola", "movies.py")),),
+                   data_name=os.path.join("esercizio001", DATA_NAME)),
+    Implementation("Enrico Cammarata", (Task("all", _script("Enrico Cammarata", "main.py")),)),
+    Implementation("Francesco Bondì", (Task("all", _script("Francesco Bondì", "Esercizio1.py")),)),
+    Implementation("Gabriele Varvarà", (Task("all", _script("Gabriele Varvarà", "esercizio_gabriele_varvara.py")),)),
+    Implementation("Giuseppe Ivan Genco", (Task("all", _script("Giuseppe Ivan Genco", "main.py")),)),
+    Implementation("Ivan Scandura", (Task("all", _script("Ivan Scandura", "main001.py")),)),
+    Implementation("Mirko Russo", (Task("all", _script("Mirko Russo", "main.py")),)),
+    Implementation("Rosario Mirabella", (Task("all", _script("Rosario Mirabella", "main.py")),)),
+)
+
+
+def run_stream(file_path):
+    # i quattro task con il motore in streaming (una sola lettura)
+    from ..stream import default_reports, run_reports
+
+    reports = default_reports()
+    run_reports(file_path, reports.values())
+    return {name: report.result() for name, report in reports.items()}
+
+
+def run_sharded(file_path):
+    from ..sharded import run_sharded as sharded
+
+    return {name: report.result() for name, report in sharded(file_path).items()}
+
+
+def write_synthetic_csv(file_path, rows, seed=0):
+    """
+    Scrive un CSV sintetico con lo stesso formato del file originale
+    (numero di classifica nel titolo, durate "1h 36m"/"2h"/"55m", MPA
+    vuoti, voti "194K", qualche campo mancante).
+
+    Args:
+        file_path (str): file da creare
+        rows (int): numero di righe
+        seed (int): seme del generatore casuale
+    """
+    rng = random.Random(seed)
+    with open(file_path, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file, lineterminator="\n")
+        writer.writerow(COLUMNS)
+        for rank in range(1, rows + 1):
+            title = " ".join(rng.choices(_WORDS, k=rng.randint(1, 4)))
+            if rng.random() < 0.05:
+                title += f", {rng.randint(2, 12)}"
+            hours, minutes = rng.randint(0, 3), rng.randint(1, 59)
+            duration = f"{hours}h {minutes}m" if hours else f"{minutes}m"
+            rating = f"{rng.uniform(1, 10):.1f}"
+            votes = f"{rng.randint(1, 999)}K" if rng.random() < 0.7 else str(rng.randint(1, 999))
+            if rng.random() < 0.01:
+                duration, rating, votes = "", "", ""
+            writer.writerow((
+                f"{rank}. {title}",
+                f"https://www.imdb.com/title/tt{rank:08d}/?ref_=sr_t_{rank}",
+                "2024",
+                duration,
+                rng.choice(_MPA_VALUES),
+                rating,
+                votes,
+            ))
+
+
+# librerie importate in anticipo (se lo script le usa) prima del cronometro
+HEAVY_MODULES = ("pandas", "numpy", "matplotlib.pyplot")
+
+# Codice eseguito nel processo figlio: importa le librerie pesanti usate dal
+# target e carica il modulo con le funzioni (tempo "import"), poi misura il
+# tempo del solo task e il picco di RSS del processo, scrive il risultato in
+# JSON.
+_DRIVER = r"""
+import ast, importlib, importlib.util, json, os, resource, runpy, sys, time
+target, args, data, out = sys.argv[1], json.loads(sys.argv[2]), sys.argv[3], sys.argv[4]
+heavy = json.loads(sys.argv[5])
+
+def imported(script):
+    with open(script, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split(".")[0])
+    return names
+
+start = time.perf_counter()
+# "pacchetto.modulo:funzione": le sue importazioni avvengono qui sotto
+script = target.split("::")[0] if "::" in target or ":" not in target else None
+used = imported(script) if script else set()
+for name in heavy:
+    if name.split(".")[0] in used:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+if "::" in target:
+    script, func = target.split("::")
+    sys.path.insert(0, os.path.dirname(script))
+    spec = importlib.util.spec_from_file_location("implementation", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    call = lambda: getattr(module, func)(data, *args)
+elif ":" in target:
+    name, func = target.split(":")
+    function = getattr(importlib.import_module(name), func)
+    call = lambda: function(data, *args)
+else:
+    sys.path.insert(0, os.path.dirname(target))
+    call = lambda: runpy.run_path(target, run_name="__main__")
+imports = time.perf_counter() - start
+
+start = time.perf_counter()
+call()
+elapsed = time.perf_counter() - start
+rss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+with open(out, "w") as f:
+    json.dump({"seconds": elapsed, "import_seconds": imports, "rss_mib": rss_kib / 1024}, f)
+"""
+
+
+def measure(implementation, task, csv_path, workdir, timeout):
+    """
+    Esegue un task in un processo separato.
+
+    Returns:
+        dict: {"seconds": float, "import_seconds": float, "rss_mib": float}
+            oppure {"error": str}
+    """
+    data_path = os.path.join(workdir, implementation.data_name)
+    os.makedirs(os.path.dirname(data_path), exist_ok=True)
+    if not os.path.exists(data_path):
+        os.symlink(csv_path, data_path)
+
+    out_path = os.path.join(workdir, "result.json")
+    env = dict(os.environ, MPLBACKEND="Agg", PYTHONPATH=EXERCISE_DIR)
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-c", _DRIVER, task.target, json.dumps(task.args), data_path, out_path,
+             json.dumps(HEAVY_MODULES)],
+            cwd=workdir, env=env, input=implementation.stdin, text=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {"error": f"timeout ({timeout}s)"}
+    if completed.returncode != 0:
+        last = completed.stderr.strip().splitlines()[-1:] or ["errore"]
+        return {"error": last[0][:60]}
+    with open(out_path) as f:
+        return json.load(f)
+
+
+def run_suite(sizes, implementations=IMPLEMENTATIONS, data_dir=None, timeout=3600):
+    """
+    Esegue tutte le soluzioni su tutte le dimensioni.
+
+    Returns:
+        list[dict]: una riga per (soluzione, task, dimensione)
+    """
+    if data_dir is None:
+        # CSV sintetici temporanei, eliminati alla fine
+        with tempfile.TemporaryDirectory(prefix="imdb_bench_") as temp_dir:
+            return run_suite(sizes, implementations, temp_dir, timeout)
+
+    results = []
+    for size in sizes:
+        csv_path = os.path.join(data_dir, f"synthetic_{size}.csv")
+        if not os.path.exists(csv_path):
+            write_synthetic_csv(csv_path, size)
+        for implementation in implementations:
+            for task in implementation.tasks:
+                with tempfile.TemporaryDirectory(dir=data_dir) as workdir:
+                    outcome = measure(implementation, task, csv_path, workdir, timeout)
+                results.append({"implementation": implementation.name, "task": task.name, "rows": size, **outcome})
+                print(f"{implementation.name:<36}{task.name:<8}{size:>12,}  {format_outcome(outcome)}", file=sys.stderr)
+    return results
+
+
+def format_outcome(outcome):
+    if "error" in outcome:
+        return f"ERRORE: {outcome['error']}"
+    return f"{outcome['seconds']:.3f} s / {outcome['rss_mib']:.0f} MiB"
+
+
+def format_import(by_size):
+    # il costo delle importazioni non dipende dalla dimensione del CSV
+    seconds = [row["import_seconds"] for row in by_size.values() if "import_seconds" in row]
+    return f"{min(seconds):.3f} s" if seconds else "-"
+
+
+def markdown_table(results, sizes):
+    """
+    Tabella di confronto: una riga per soluzione e task, una colonna per
+    dimensione, ordinata per tempo sulla dimensione più grande. La colonna
+    "import" riporta il tempo di caricamento escluso dalle misure.
+    """
+    cells = {}
+    for row in results:
+        cells.setdefault((row["implementation"], row["task"]), {})[row["rows"]] = row
+
+    def sort_key(item):
+        largest = item[1].get(sizes[-1], {})
+        return largest.get("seconds", float("inf"))
+
+    lines = [
+        "| Soluzione | Task | import | " + " | ".join(f"{size:,} righe" for size in sizes) + " |",
+        "|---|---|---|" + "---|" * len(sizes),
+    ]
+    for (name, task), by_size in sorted(cells.items(), key=sort_key):
+        values = [format_outcome(by_size[size]) if size in by_size else "-" for size in sizes]
+        lines.append(f"| {name} | {task} | {format_import(by_size)} | " + " | ".join(values) + " |")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="numero di righe dei CSV sintetici, separati da virgola")
+    parser.add_argument("--only", help="esegue solo le soluzioni il cui nome contiene questo testo")
+    parser.add_argument("--data-dir", help="cartella per i CSV sintetici (riutilizzati se presenti)")
+    parser.add_argument("--timeout", type=int, default=3600, help="secondi massimi per task")
+    parser.add_argument("--output", help="file Markdown in cui salvare la tabella")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    implementations = [
+        implementation for implementation in IMPLEMENTATIONS
+        if not args.only or args.only.lower() in implementation.name.lower()
+    ]
+    if args.data_dir:
+        os.makedirs(args.data_dir, exist_ok=True)
+
+    results = run_suite(sizes, implementations, args.data_dir, args.timeout)
+    table = markdown_table(results, sizes)
+    print(table)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(table + "\n")
+
+
+if __name__ == "__main__":
+    main()
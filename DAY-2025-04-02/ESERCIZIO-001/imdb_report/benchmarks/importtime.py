@@ -0,0 +1,83 @@
+"""
+Verifica dei tempi di import dell'entry point con `python -X importtime`.
+
+Ogni modulo misurato viene importato in un processo Python nuovo; il
+report mostra il tempo cumulativo e i moduli più costosi, e il comando
+fallisce se un modulo supera il suo budget o importa una libreria pesante
+che all'avvio non dovrebbe servire.
+
+    python -m imdb_report.benchmarks.importtime
+"""
+import argparse
+import re
+import subprocess
+import sys
+
+# modulo -> budget in millisecondi (tempo cumulativo del modulo)
+BUDGETS_MS = {
+    "imdb_report": 60,
+    "imdb_report.__main__": 60,
+}
+
+# librerie che l'avvio non deve importare
+HEAVY_MODULES = ("pandas", "numpy", "matplotlib", "seaborn", "natsort")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def import_times(module, python=sys.executable):
+    """
+    Importa `module` in un nuovo interprete e legge l'output di -X importtime.
+
+    Returns:
+        dict[str, tuple[int, int]]: modulo -> (tempo proprio, cumulativo) in µs
+    """
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            times[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return times
+
+
+def check(module, budget_ms, top=5):
+    """
+    Stampa il report di un modulo.
+
+    Returns:
+        list[str]: problemi trovati (vuota se il modulo rispetta il budget)
+    """
+    times = import_times(module)
+    total_ms = times[module][1] / 1000
+    print(f"{module}: {total_ms:.1f} ms (budget {budget_ms} ms)")
+    for name, (own, _) in sorted(times.items(), key=lambda item: -item[1][0])[:top]:
+        print(f"    {own / 1000:8.1f} ms  {name}")
+
+    problems = []
+    if total_ms > budget_ms:
+        problems.append(f"{module}: {total_ms:.1f} ms oltre il budget di {budget_ms} ms")
+    heavy = sorted({name.split(".")[0] for name in times} & set(HEAVY_MODULES))
+    if heavy:
+        problems.append(f"{module}: importa all'avvio {', '.join(heavy)}")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=1.0, help="moltiplica i budget (macchine lente)")
+    args = parser.parse_args(argv)
+
+    problems = []
+    for module, budget_ms in BUDGETS_MS.items():
+        problems += check(module, budget_ms * args.scale)
+    for problem in problems:
+        print(f"ERRORE {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
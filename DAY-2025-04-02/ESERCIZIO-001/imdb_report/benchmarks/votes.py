@@ -0,0 +1,67 @@
+"""
+Confronto tra la conversione dei voti riga per riga (`convert_votes` di
+`fill_nan_with_mean`, Salvatore Viganò) e `parse_votes_column`.
+
+    python -m imdb_report.benchmarks.votes --rows 1000000
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from ..columns import MISSING_VOTES, parse_votes_column
+from .duration import timed
+
+
+def convert_votes(vote_str):
+    # versione di riferimento, copiata da esercizio001.py
+    if pd.isna(vote_str):
+        return np.nan
+    if isinstance(vote_str, (int, float)):
+        return vote_str
+    vote_str = str(vote_str).upper()
+    if 'K' in vote_str:
+        return float(vote_str.replace('K', '')) * 1000
+    return float(vote_str)
+
+
+def synthetic_votes(rows, seed=0):
+    """
+    Genera una colonna di voti nei formati presenti nel CSV ("194K",
+    "9.5K", "429") con qualche valore mancante.
+
+    Args:
+        rows (int): numero di righe
+        seed (int): seme del generatore casuale
+
+    Returns:
+        pandas.Series: colonna di stringhe (NaN per i mancanti)
+    """
+    rng = np.random.default_rng(seed)
+    plain = pd.Series(rng.integers(1, 1000, rows)).astype(str)
+    thousands = pd.Series(rng.integers(10, 999, rows) / 10).astype(str) + "K"
+    kind = rng.integers(0, 10, rows)
+
+    column = thousands.mask(kind < 3, plain)
+    return column.mask(kind == 9, np.nan)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    column = synthetic_votes(args.rows)
+    print(f"Righe: {args.rows:,}")
+
+    baseline, t_apply = timed("apply + convert_votes", column.apply, convert_votes)
+    vectorized, t_vector = timed("parse_votes_column", parse_votes_column, column)
+
+    expected = np.rint(baseline.fillna(MISSING_VOTES).to_numpy(dtype="float64"))
+    assert (expected == vectorized).all(), "i due parser non coincidono"
+
+    print(f"Speedup: {t_apply / t_vector:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
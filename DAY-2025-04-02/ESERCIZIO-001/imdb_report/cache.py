@@ -0,0 +1,195 @@
+"""
+Cache colonnare binaria del dataset già ripulito.
+
+Al primo caricamento il CSV viene letto, riallineato e convertito; ogni
+colonna tipizzata viene salvata come file NumPy `.npy` in
+`.imdb_cache/<nome file>-<firma>/`. I testi (titolo, chiave di ordinamento,
+link, MPA) sono salvati come in `films.StringColumn`: un buffer UTF-8
+(`<nome>.data.npy`) più gli offset int64 (`<nome>.offsets.npy`), così la
+cache occupa circa quanto il CSV invece di un array `<U...>` a larghezza
+fissa (4 byte per carattere del testo più lungo). Le esecuzioni successive
+non fanno parsing: i file vengono aperti in memory-map
+(`np.load(mmap_mode="r")`).
+
+La firma (dimensione + data di modifica, vedi `signature.py`) invalida la
+cache automaticamente quando il CSV cambia.
+"""
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from .columns import parse_duration_column, parse_votes_column, title_key_column
+from .films import StringColumn
+from .repair import read_raw, realign_shifted_rows
+from .signature import dataset_signature
+
+CACHE_DIR = ".imdb_cache"
+
+# Sentinella per l'anno mancante (gli interi NumPy non hanno NaN); per i
+# voti si usa MISSING_VOTES di columns.py
+MISSING_YEAR = -1
+
+# Ordine delle colonne salvate
+CACHED_COLUMNS = ("title", "title_key", "link", "year", "minutes", "mpa", "rating", "votes")
+
+# colonne testuali, salvate come buffer UTF-8 + offset
+TEXT_COLUMNS = ("title", "title_key", "link", "mpa")
+
+
+def cache_path(file_path):
+    """
+    Cartella della cache per il CSV indicato.
+
+    Args:
+        file_path (str): percorso del CSV
+
+    Returns:
+        str: cartella `.imdb_cache/<nome>-<firma>` accanto al CSV
+    """
+    folder, name = os.path.split(os.path.abspath(file_path))
+    return os.path.join(folder, CACHE_DIR, f"{name}-{dataset_signature(file_path)}")
+
+
+def parse_frame(frame):
+    """
+    Converte un DataFrame grezzo (letto con `read_raw`) nelle colonne
+    tipizzate; usata anche per i singoli blocchi di `chunked.py`.
+
+    Args:
+        frame (pandas.DataFrame): dati grezzi
+
+    Returns:
+        dict[str, numpy.ndarray]: una colonna per ogni nome di CACHED_COLUMNS
+        (i testi come array di oggetti `str`)
+    """
+    frame = realign_shifted_rows(frame, inplace=True).frame
+
+    titles = frame["Title"].str.replace(r"^\d+\.\s*", "", regex=True).str.strip()
+    year = pd.to_numeric(frame["Year"], errors="coerce")
+
+    return {
+        "title": titles.to_numpy(dtype=object),
+        "title_key": title_key_column(frame["Title"]).to_numpy(dtype=object),
+        "link": frame["Movie Link"].to_numpy(dtype=object),
+        "year": year.fillna(MISSING_YEAR).to_numpy(dtype=np.int16),
+        "minutes": parse_duration_column(frame["Duration"]),
+        "mpa": frame["MPA"].str.strip().to_numpy(dtype=object),
+        "rating": pd.to_numeric(frame["Rating"], errors="coerce").to_numpy(dtype=np.float64),
+        "votes": parse_votes_column(frame["Votes"]),
+    }
+
+
+def parse_movies(file_path):
+    """
+    Legge il CSV e produce le colonne tipizzate.
+
+    Args:
+        file_path (str): percorso del CSV
+
+    Returns:
+        dict[str, numpy.ndarray]: una colonna per ogni nome di CACHED_COLUMNS
+    """
+    return parse_frame(read_raw(file_path))
+
+
+def write_cache(file_path, columns):
+    """
+    Salva le colonne nella cache, sostituendo eventuali versioni precedenti.
+
+    La scrittura avviene in una cartella temporanea rinominata alla fine:
+    un processo interrotto non lascia mai una cache parziale.
+
+    Args:
+        file_path (str): percorso del CSV
+        columns (dict[str, numpy.ndarray]): colonne da salvare
+    """
+    target = cache_path(file_path)
+    root = os.path.dirname(target)
+    os.makedirs(root, exist_ok=True)
+
+    staging = tempfile.mkdtemp(dir=root)
+    for name, values in columns.items():
+        if name in TEXT_COLUMNS:
+            text = StringColumn.from_values(values)
+            np.save(os.path.join(staging, f"{name}.data.npy"), np.frombuffer(text.data, dtype=np.uint8))
+            np.save(os.path.join(staging, f"{name}.offsets.npy"), text.offsets)
+        else:
+            np.save(os.path.join(staging, f"{name}.npy"), values)
+    with open(os.path.join(staging, "meta.json"), "w", encoding="utf-8") as meta:
+        json.dump({"source": os.path.basename(file_path), "rows": len(columns["title"])}, meta)
+
+    # le cache di versioni precedenti dello stesso file non servono più
+    prefix = os.path.basename(file_path) + "-"
+    for entry in os.listdir(root):
+        old = os.path.join(root, entry)
+        if entry.startswith(prefix) and old != staging:
+            shutil.rmtree(old, ignore_errors=True)
+    os.replace(staging, target)
+
+
+def read_cache(file_path):
+    """
+    Apre in memory-map le colonne in cache, se aggiornate.
+
+    Args:
+        file_path (str): percorso del CSV
+
+    Returns:
+        dict[str, numpy.ndarray | StringColumn] | None: colonne in sola
+        lettura (i testi come `StringColumn`), None se la cache non esiste o
+        è incompleta
+    """
+    folder = cache_path(file_path)
+
+    def load(name):
+        return np.load(os.path.join(folder, f"{name}.npy"), mmap_mode="r")
+
+    try:
+        return {
+            name: StringColumn(load(f"{name}.data"), load(f"{name}.offsets")) if name in TEXT_COLUMNS else load(name)
+            for name in CACHED_COLUMNS
+        }
+    except (OSError, ValueError):
+        return None
+
+
+def load_columns(file_path, refresh=False):
+    """
+    Restituisce le colonne tipizzate del CSV, usando la cache se possibile.
+
+    Args:
+        file_path (str): percorso del CSV
+        refresh (bool): se True ignora la cache e la ricostruisce
+
+    Returns:
+        dict[str, numpy.ndarray | StringColumn]: colonne di CACHED_COLUMNS
+        (vedi `read_cache`)
+    """
+    columns = None if refresh else read_cache(file_path)
+    if columns is None:
+        write_cache(file_path, parse_movies(file_path))
+        columns = read_cache(file_path)
+    return columns
+
+
+def load_movies(file_path, refresh=False):
+    """
+    Carica il dataset già ripulito come DataFrame.
+
+    Args:
+        file_path (str): percorso del CSV
+        refresh (bool): se True ignora la cache e la ricostruisce
+
+    Returns:
+        pandas.DataFrame: colonne title, title_key, link, year, minutes,
+        mpa, rating, votes
+    """
+    columns = load_columns(file_path, refresh)
+    return pd.DataFrame({
+        name: values.to_numpy() if name in TEXT_COLUMNS else values
+        for name, values in columns.items()
+    }, copy=False)
@@ -0,0 +1,103 @@
+"""
+Colonne categoriche codificate a dizionario con indice dei gruppi.
+
+MPA e anno hanno pochissimi valori distinti. Invece di ripetere
+`value_counts` / `groupby` / un ciclo con `defaultdict` a ogni richiesta,
+al caricamento si calcolano una volta:
+- `categories`: i valori distinti, `codes`: il codice di ogni riga;
+- `counts` e `offsets`: quanti film per gruppo e dove inizia ogni gruppo
+  in `order`, l'elenco delle righe ordinate per gruppo.
+
+Dopo la costruzione, conteggi, medie per gruppo precalcolate e righe di un
+gruppo costano O(numero di categorie) oppure O(righe restituite).
+"""
+import numpy as np
+
+
+class GroupIndex:
+    """Codifica a dizionario di una colonna con indice delle righe per gruppo."""
+
+    def __init__(self, categories, codes):
+        self.categories = list(categories)
+        self.codes = codes
+        self.positions = {category: code for code, category in enumerate(self.categories)}
+
+        self.counts = np.bincount(codes, minlength=len(self.categories))
+        self.offsets = np.zeros(len(self.categories) + 1, dtype=np.int64)
+        np.cumsum(self.counts, out=self.offsets[1:])
+        # righe raggruppate per categoria (stabile: ordine del file nel gruppo)
+        self.order = np.argsort(codes, kind="stable")
+
+    @classmethod
+    def from_values(cls, values):
+        """
+        Codifica una colonna.
+
+        Args:
+            values (numpy.ndarray | pandas.Series): valori della colonna
+
+        Returns:
+            GroupIndex: indice della colonna
+        """
+        categories, codes = np.unique(np.asarray(values), return_inverse=True)
+        dtype = np.uint8 if len(categories) <= np.iinfo(np.uint8).max else np.uint32
+        # tolist: scalari Python sia da array NumPy tipizzati sia da array di oggetti
+        return cls(categories.tolist(), codes.reshape(-1).astype(dtype))
+
+    def __len__(self):
+        return len(self.codes)
+
+    def code(self, category):
+        """Codice della categoria, None se non presente."""
+        return self.positions.get(category)
+
+    def count(self, category):
+        """Numero di righe della categoria (O(1))."""
+        code = self.code(category)
+        return 0 if code is None else int(self.counts[code])
+
+    def value_counts(self):
+        """
+        Conteggi per categoria, dal più frequente (O(categorie)).
+
+        Returns:
+            dict: categoria -> numero di righe
+        """
+        ranking = np.argsort(-self.counts, kind="stable")
+        return {self.categories[code]: int(self.counts[code]) for code in ranking}
+
+    def rows(self, category):
+        """
+        Posizioni delle righe di una categoria, senza scandire la colonna.
+
+        Returns:
+            numpy.ndarray: posizioni (vista su `order`)
+        """
+        code = self.code(category)
+        if code is None:
+            return self.order[:0]
+        return self.order[self.offsets[code]:self.offsets[code + 1]]
+
+    def group_mean(self, values, missing=None):
+        """
+        Media di una colonna numerica per categoria, in una sola passata.
+
+        Args:
+            values (numpy.ndarray): colonna allineata alle righe
+            missing (int | float | None): sentinella dei valori da escludere
+                (i NaN sono sempre esclusi)
+
+        Returns:
+            dict: categoria -> media (NaN se il gruppo non ha valori validi)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        valid = ~np.isnan(values)
+        if missing is not None:
+            valid &= values != missing
+
+        size = len(self.categories)
+        sums = np.bincount(self.codes, weights=np.where(valid, values, 0.0), minlength=size)
+        counts = np.bincount(self.codes, weights=valid.astype(np.float64), minlength=size)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+        return dict(zip(self.categories, means.tolist()))
@@ -0,0 +1,183 @@
+"""
+Report su DataFrame letti a blocchi (`pd.read_csv(..., chunksize=...)`).
+
+Le funzioni hanno lo stesso nome di quelle di esercizio001.py
+(`movies_by_mpa`, `count_long_movies`, `movies_with_high_rating`) ma
+accettano un DataFrame oppure un iteratore di blocchi e restituiscono un
+risultato parziale fondibile (gli stessi `Report` del motore in
+streaming). La memoria dipende solo dalla dimensione del blocco:
+
+    chunks = read_chunks("imdb_full.csv", chunksize=200_000)
+    mpa = movies_by_mpa(chunks)
+
+Per calcolare più report con una sola lettura si usa `run_chunked`. I
+risultati di porzioni diverse si combinano con `Report.merge`.
+"""
+import pandas as pd
+
+from .cache import MISSING_YEAR, parse_frame
+from .columns import INVALID_MINUTES, MISSING_VOTES
+from .repair import read_raw
+from .stream import EMPTY_MPA, HighRatingReport, LongMovieCount, Movie, MpaTable
+from .topk import TopRatedReport
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def read_chunks(file_path, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Legge il CSV a blocchi già ripuliti e tipizzati.
+
+    Args:
+        file_path (str): percorso del CSV
+        chunksize (int): righe per blocco
+
+    Yields:
+        pandas.DataFrame: blocco con le colonne di `cache.CACHED_COLUMNS`
+    """
+    for raw in read_raw(file_path, chunksize=chunksize):
+        yield pd.DataFrame(parse_frame(raw), copy=False)
+
+
+def _as_chunks(data):
+    # un DataFrame singolo è un iteratore di un solo blocco
+    return [data] if isinstance(data, pd.DataFrame) else data
+
+
+def to_movies(frame):
+    """
+    Converte le righe di un blocco in `Movie` (sentinelle -> None).
+
+    Da usare solo sulle righe già selezionate, non sull'intero blocco.
+    """
+    for title, link, year, minutes, mpa, rating, votes in frame[list(Movie._fields)].itertuples(index=False, name=None):
+        yield Movie(
+            title=title,
+            link=link,
+            year=None if year == MISSING_YEAR else int(year),
+            minutes=None if minutes == INVALID_MINUTES else int(minutes),
+            mpa=mpa,
+            rating=None if pd.isna(rating) else float(rating),
+            votes=None if votes == MISSING_VOTES else int(votes),
+        )
+
+
+def update_mpa(report, chunk):
+    counts = chunk["mpa"].replace("", EMPTY_MPA).value_counts()
+    report.counts.update(counts.to_dict())
+
+
+def update_long_movies(report, chunk):
+    report.count += int((chunk["minutes"] >= report.min_minutes).sum())
+
+
+def update_high_rating(report, chunk):
+    selected = chunk[chunk["rating"] > report.threshold]
+    report.count += len(selected)
+    for movie in to_movies(selected):
+        if report.sink is not None:
+            report.sink(movie)
+        else:
+            report.movies.append(movie)
+
+
+def update_top_rated(report, chunk):
+    selected = chunk["rating"]
+    if report.threshold is not None:
+        selected = selected[selected > report.threshold]
+    # al massimo k candidati per blocco entrano nell'heap
+    for movie in to_movies(chunk.loc[selected.nlargest(report.k).index]):
+        report.feed(movie)
+
+
+# funzione di aggiornamento vettoriale per ogni tipo di report
+UPDATERS = {
+    MpaTable: update_mpa,
+    LongMovieCount: update_long_movies,
+    HighRatingReport: update_high_rating,
+    TopRatedReport: update_top_rated,
+}
+
+
+def run_chunked(chunks, reports):
+    """
+    Aggiorna più report con una sola passata sui blocchi.
+
+    Args:
+        chunks (pandas.DataFrame | Iterable[pandas.DataFrame]): dati
+        reports (Iterable[Report]): report da aggiornare (tipi di UPDATERS)
+
+    Returns:
+        int: numero di righe elaborate
+    """
+    updates = [(UPDATERS[type(report)], report) for report in reports]
+    rows = 0
+    for chunk in _as_chunks(chunks):
+        rows += len(chunk)
+        for update, report in updates:
+            update(report, chunk)
+    return rows
+
+
+def movies_by_mpa(chunks, partial=None):
+    """
+    Totale dei film per MPA.
+
+    Args:
+        chunks (pandas.DataFrame | Iterable[pandas.DataFrame]): dati
+        partial (MpaTable | None): risultato parziale da continuare
+
+    Returns:
+        MpaTable: conteggi (`result()` per la tabella)
+    """
+    partial = partial or MpaTable()
+    run_chunked(chunks, [partial])
+    return partial
+
+
+def count_long_movies(chunks, min_minutes=120, partial=None):
+    """
+    Numero di film con durata >= `min_minutes`.
+
+    Args:
+        chunks (pandas.DataFrame | Iterable[pandas.DataFrame]): dati
+        min_minutes (int): durata minima in minuti
+        partial (LongMovieCount | None): risultato parziale da continuare
+
+    Returns:
+        LongMovieCount: conteggio (`result()` per il numero)
+    """
+    partial = partial or LongMovieCount(min_minutes)
+    run_chunked(chunks, [partial])
+    return partial
+
+
+def movies_with_high_rating(chunks, threshold=7.5, sink=None, partial=None):
+    """
+    Film con rating superiore a `threshold`.
+
+    Args:
+        chunks (pandas.DataFrame | Iterable[pandas.DataFrame]): dati
+        threshold (float): soglia esclusiva
+        sink (Callable[[Movie], None] | None): se indicato riceve i film
+            selezionati, che non restano in memoria
+        partial (HighRatingReport | None): risultato parziale da continuare
+
+    Returns:
+        HighRatingReport: film selezionati (`result()`) e `count`
+    """
+    partial = partial or HighRatingReport(threshold, sink)
+    run_chunked(chunks, [partial])
+    return partial
+
+
+def top_rated_movies(chunks, k, threshold=None, partial=None):
+    """
+    I `k` film con rating più alto, con un heap di dimensione limitata.
+
+    Returns:
+        TopRatedReport: film migliori (`result()`)
+    """
+    partial = partial or TopRatedReport(k, threshold)
+    run_chunked(chunks, [partial])
+    return partial
@@ -0,0 +1,117 @@
+"""
+Parser vettoriali (un'intera colonna alla volta) per il dataset IMDb.
+
+Sostituiscono i vari `df['Duration'].apply(duration_to_minutes)` delle
+soluzioni: invece di una chiamata Python con `re.match` per ogni riga, la
+colonna viene ridotta ai valori distinti con `pd.factorize`, ognuno viene
+convertito una sola volta e il risultato viene riportato su tutte le righe
+con un'indicizzazione NumPy. (Le catene `.str.extract` di pandas eseguono
+comunque un'espressione regolare Python per elemento e sono più lente di
+`apply`.)
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from .titles import NUMBER_WIDTH
+
+# Valore sentinella per durate mancanti o non valide (il dtype è int16,
+# quindi NaN non è rappresentabile)
+INVALID_MINUTES = -1
+
+# Sentinella per numeri di voti mancanti o non validi
+MISSING_VOTES = -1
+
+_DURATION_PATTERN = re.compile(r"^\s*(?:(?P<hours>\d+)h)?\s*(?:(?P<minutes>\d+)m)?\s*$")
+_VOTES_PATTERN = re.compile(r"^(?P<number>\d+(?:\.\d+)?)(?P<suffix>[KMB]?)$")
+_VOTE_SUFFIXES = {"": 1.0, "K": 1e3, "M": 1e6, "B": 1e9}
+
+
+def _map_distinct(values, parse, dtype, missing):
+    """
+    Applica `parse` una sola volta per ogni valore distinto della colonna e
+    riporta i risultati su tutte le righe con un'indicizzazione NumPy.
+
+    Durate e voti hanno pochi valori distinti rispetto alle righe: il
+    lavoro per riga (`pd.factorize` e la `take` finale) è tutto in C.
+
+    Args:
+        values (pandas.Series | Sequence[str]): colonna
+        parse (Callable[[str], int | None]): conversione di un valore
+        dtype (numpy.dtype): tipo del risultato
+        missing (int): valore per mancanti e non validi
+
+    Returns:
+        numpy.ndarray: colonna convertita
+    """
+    codes, uniques = pd.factorize(pd.Series(values, copy=False))
+    parsed = [parse(str(value)) for value in uniques]
+    # in fondo il valore per i mancanti: il codice -1 di factorize lo seleziona
+    table = np.array([missing if value is None else value for value in parsed] + [missing], dtype=dtype)
+    return table[codes]
+
+
+def _duration_minutes(text):
+    match = _DURATION_PATTERN.match(text)
+    if match is None or not (match["hours"] or match["minutes"]):
+        return None
+    total = int(match["hours"] or 0) * 60 + int(match["minutes"] or 0)
+    return total if total <= np.iinfo(np.int16).max else None
+
+
+def _votes_count(text):
+    match = _VOTES_PATTERN.match(text.strip().upper().replace(",", ""))
+    if match is None:
+        return None
+    votes = round(float(match["number"]) * _VOTE_SUFFIXES[match["suffix"]])
+    return votes if votes <= np.iinfo(np.int64).max else None
+
+
+def parse_duration_column(values):
+    """
+    Converte una colonna di durate ("1h 36m", "55m", "2h") in minuti.
+
+    Args:
+        values (pandas.Series | Sequence[str]): colonna Duration
+
+    Returns:
+        numpy.ndarray: array int16 dei minuti, INVALID_MINUTES dove il
+        valore è mancante o non riconosciuto
+    """
+    return _map_distinct(values, _duration_minutes, np.int16, INVALID_MINUTES)
+
+
+def parse_votes_column(values):
+    """
+    Converte una colonna di voti ("194K", "1.5K", "2.1M", "1,234", "22")
+    in interi, interpretando una sola volta ogni valore distinto.
+
+    Args:
+        values (pandas.Series | Sequence[str]): colonna Votes
+
+    Returns:
+        numpy.ndarray: array int64, MISSING_VOTES dove il valore è mancante
+        o non riconosciuto
+    """
+    return _map_distinct(values, _votes_count, np.int64, MISSING_VOTES)
+
+
+def title_key_column(values):
+    """
+    Versione per colonne di `titles.title_key`.
+
+    Args:
+        values (pandas.Series | Sequence[str]): colonna Title
+
+    Returns:
+        pandas.Series: chiavi di ordinamento normalizzate
+    """
+    keys = (
+        pd.Series(values, copy=False).astype("string")
+        .str.replace(r"^\d+\.\s*", "", regex=True)
+        .str.strip()
+        .str.replace(r"^(?:the|a|an)\s+", "", case=False, regex=True)
+        .str.casefold()
+    )
+    return keys.str.replace(r"\d+", lambda m: m.group().zfill(NUMBER_WIDTH), regex=True)
@@ -0,0 +1,133 @@
+"""
+Ordinamento esterno dei titoli (merge sort su disco).
+
+`ordina_per_titoli`, `listOrderByTitle` e `TitleSortReport` tengono tutti i
+titoli in memoria per ordinarli. Qui la memoria usata è fissa:
+1. i titoli vengono letti in streaming e accumulati a blocchi di
+   `run_size` righe;
+2. ogni blocco viene ordinato per chiave normalizzata (`titles.title_key`)
+   e scritto in un file temporaneo ("run");
+3. i run vengono fusi con `heapq.merge` (k-way merge) mentre il CSV
+   ordinato viene scritto; se i run sono più di `max_open` si fondono
+   prima a gruppi, così i file aperti restano limitati.
+
+L'ordinamento è stabile: a parità di chiave si conserva l'ordine del file.
+
+Uso:
+    python -m imdb_report.extsort imdb_movies_2024.csv film_ordine_alfabetico.csv
+"""
+import argparse
+import csv
+import heapq
+import os
+import tempfile
+from itertools import islice
+from operator import itemgetter
+
+from .stream import iter_movies
+from .titles import title_key
+
+DEFAULT_RUN_SIZE = 1_000_000
+DEFAULT_MAX_OPEN = 64
+
+_key = itemgetter(0)
+
+
+def _write_run(records, folder):
+    """Scrive un blocco già ordinato in un file temporaneo e ne restituisce il percorso."""
+    handle, path = tempfile.mkstemp(suffix=".run", dir=folder)
+    with open(handle, "w", newline="", encoding="utf-8") as run:
+        csv.writer(run, lineterminator="\n").writerows(records)
+    return path
+
+
+def _read_run(path):
+    with open(path, newline="", encoding="utf-8") as run:
+        yield from csv.reader(run)
+
+
+def _merge_runs(paths):
+    return heapq.merge(*(_read_run(path) for path in paths), key=_key)
+
+
+def external_sort(records, run_size=DEFAULT_RUN_SIZE, max_open=DEFAULT_MAX_OPEN, tmp_dir=None):
+    """
+    Ordina per il primo campo una sequenza di tuple di stringhe
+    arbitrariamente lunga, tenendo in memoria al massimo `run_size` righe.
+
+    Args:
+        records (Iterable[tuple[str, ...]]): righe (chiave, valori...)
+        run_size (int): righe per run ordinato in memoria
+        max_open (int): numero massimo di run fusi in una volta
+        tmp_dir (str | None): cartella per i file temporanei
+
+    Yields:
+        list[str]: righe ordinate per chiave
+    """
+    if run_size < 1 or max_open < 2:
+        raise ValueError("run_size deve essere >= 1 e max_open >= 2")
+
+    records = iter(records)
+    with tempfile.TemporaryDirectory(prefix="imdb-extsort-", dir=tmp_dir) as folder:
+        runs = []
+        while block := list(islice(records, run_size)):
+            block.sort(key=_key)
+            # un solo blocco: non serve passare dal disco
+            if not runs and len(block) < run_size:
+                yield from block
+                return
+            runs.append(_write_run(block, folder))
+            del block
+
+        # fusione a più passate: i run più vecchi prima, per la stabilità
+        while len(runs) > max_open:
+            group, runs = runs[:max_open], runs[max_open:]
+            runs.insert(0, _write_run(_merge_runs(group), folder))
+            for path in group:
+                os.remove(path)
+
+        yield from _merge_runs(runs)
+
+
+def sort_titles(file_path, output_path, run_size=DEFAULT_RUN_SIZE, max_open=DEFAULT_MAX_OPEN,
+                encoding="utf-8", tmp_dir=None):
+    """
+    Scrive il CSV dei titoli in ordine alfabetico naturale con memoria fissa.
+
+    Args:
+        file_path (str): CSV dei film
+        output_path (str): CSV di destinazione (colonna "Title")
+        run_size (int): righe per run ordinato in memoria
+        max_open (int): numero massimo di run fusi in una volta
+        encoding (str): codifica del CSV dei film
+        tmp_dir (str | None): cartella per i file temporanei
+
+    Returns:
+        int: numero di titoli scritti
+    """
+    records = ((title_key(movie.title), movie.title) for movie in iter_movies(file_path, encoding))
+    written = 0
+    with open(output_path, "w", newline="", encoding="utf-8") as output:
+        writer = csv.writer(output, lineterminator="\n")
+        writer.writerow(("Title",))
+        for _, title in external_sort(records, run_size, max_open, tmp_dir):
+            writer.writerow((title,))
+            written += 1
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ordinamento esterno dei titoli di un CSV IMDb")
+    parser.add_argument("file_path")
+    parser.add_argument("output_path")
+    parser.add_argument("--run-size", type=int, default=DEFAULT_RUN_SIZE, help="righe per run in memoria")
+    parser.add_argument("--max-open", type=int, default=DEFAULT_MAX_OPEN, help="run fusi in una volta")
+    parser.add_argument("--tmp-dir", help="cartella per i file temporanei")
+    args = parser.parse_args(argv)
+
+    written = sort_titles(args.file_path, args.output_path, args.run_size, args.max_open, tmp_dir=args.tmp_dir)
+    print(f"{written} titoli scritti in {args.output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Collezione compatta di film "struct of arrays" basata su NumPy.
+
+Nella soluzione a oggetti (Agostino Isgrò) ogni riga diventa un'istanza di
+`Film` con il proprio `__dict__`, costruita con `df.iterrows()`: centinaia
+di byte per film più un oggetto stringa per ogni campo. Qui ogni campo è
+un unico array per tutta la collezione:
+- numeri in array interi piccoli (anno e durata int16, rating in decimi
+  int16, voti int64);
+- MPA e anno codificati a dizionario con indice dei gruppi
+  (`categorical.GroupIndex`);
+- testi (titolo, link) in un solo buffer UTF-8 con un array di offset.
+
+Ordinamenti, filtri e raggruppamenti restituiscono array di indici; gli
+oggetti `Film` vengono creati solo quando si leggono le righe selezionate.
+
+Esempio:
+    films = FilmStore.from_columns(load_columns("imdb_movies_2024.csv"))
+    for film in films.rows(films.sort_by("title")):
+        print(film.title)
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from .categorical import GroupIndex
+from .columns import INVALID_MINUTES, MISSING_VOTES
+from .stream import EMPTY_MPA
+
+# sentinella per anno e rating mancanti
+MISSING = -1
+
+
+class Film(NamedTuple):
+    """Vista di un singolo film, creata solo quando serve."""
+    title: str
+    link: str
+    year: int | None
+    minutes: int | None
+    mpa: str
+    rating: float | None
+    votes: int | None
+
+
+class StringColumn:
+    """
+    Colonna di testi memorizzata come buffer UTF-8 + offset.
+
+    `data` può essere un oggetto `bytes` oppure un array uint8 (anche in
+    memory-map, come nella cache di `cache.py`): l'i-esimo testo è
+    `data[offsets[i]:offsets[i + 1]]`.
+    """
+
+    def __init__(self, data, offsets):
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def from_values(cls, values):
+        if isinstance(values, cls):
+            return values
+        encoded = [str(value).encode("utf-8") for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(item) for item in encoded], out=offsets[1:])
+        return cls(b"".join(encoded), offsets)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return str(self.data[self.offsets[i]:self.offsets[i + 1]], "utf-8")
+
+    def __iter__(self):
+        data = bytes(self.data)
+        bounds = self.offsets.tolist()
+        return (data[start:end].decode("utf-8") for start, end in zip(bounds, bounds[1:]))
+
+    def to_numpy(self):
+        """Testi come array di oggetti `str` (es. per un DataFrame)."""
+        return np.array(list(self), dtype=object)
+
+    @property
+    def nbytes(self):
+        return len(self.data) + self.offsets.nbytes
+
+
+def _text_values(values):
+    # StringColumn -> array NumPy di testi per argsort / np.unique
+    return np.array(list(values)) if isinstance(values, StringColumn) else np.asarray(values)
+
+
+class FilmStore:
+    """Film memorizzati per colonne; le operazioni lavorano su array di posizioni."""
+
+    def __init__(self, title, link, title_order, year, minutes, mpa, rating10, votes):
+        self.title = title
+        self.link = link
+        # posizioni dei film in ordine di titolo normalizzato (titles.title_key)
+        self.title_order = title_order
+        self.year = year
+        self.minutes = minutes
+        self.mpa = mpa
+        self.year_index = GroupIndex.from_values(year)
+        # rating in decimi: 7.6 -> 76, confronti esatti senza virgola mobile
+        self.rating10 = rating10
+        self.votes = votes
+        # aggregato precalcolato (come MPA_duration di Gabriele Varvarà)
+        self.mean_minutes_by_mpa = mpa.group_mean(minutes, missing=INVALID_MINUTES)
+
+    @classmethod
+    def from_columns(cls, columns):
+        """
+        Costruisce la collezione in blocco dalle colonne tipizzate.
+
+        Args:
+            columns (dict | pandas.DataFrame): colonne di `cache.CACHED_COLUMNS`
+                (es. `cache.load_columns` o `cache.load_movies`); i testi
+                già in forma di `StringColumn` vengono usati senza copia
+
+        Returns:
+            FilmStore: collezione compatta
+        """
+        rating = np.asarray(columns["rating"], dtype=np.float64)
+        rating10 = np.where(np.isnan(rating), MISSING, np.rint(rating * 10)).astype(np.int16)
+
+        return cls(
+            title=StringColumn.from_values(columns["title"]),
+            link=StringColumn.from_values(columns["link"]),
+            title_order=np.argsort(_text_values(columns["title_key"]), kind="stable").astype(np.uint32),
+            year=np.asarray(columns["year"], dtype=np.int16),
+            minutes=np.asarray(columns["minutes"], dtype=np.int16),
+            mpa=GroupIndex.from_values(_text_values(columns["mpa"])),
+            rating10=rating10,
+            votes=np.asarray(columns["votes"], dtype=np.int64),
+        )
+
+    def __len__(self):
+        return len(self.year)
+
+    @property
+    def nbytes(self):
+        """Memoria occupata dai dati della collezione (in byte)."""
+        arrays = (
+            self.title_order, self.year, self.minutes, self.rating10, self.votes,
+            self.mpa.codes, self.mpa.order, self.year_index.codes, self.year_index.order,
+        )
+        return self.title.nbytes + self.link.nbytes + sum(array.nbytes for array in arrays)
+
+    # --- lettura ---------------------------------------------------------
+
+    def film(self, i):
+        """Crea il `Film` in posizione `i`."""
+        year, minutes, rating10, votes = self.year[i], self.minutes[i], self.rating10[i], self.votes[i]
+        return Film(
+            title=self.title[i],
+            link=self.link[i],
+            year=None if year == MISSING else int(year),
+            minutes=None if minutes == INVALID_MINUTES else int(minutes),
+            mpa=self.mpa.categories[self.mpa.codes[i]],
+            rating=None if rating10 == MISSING else rating10 / 10,
+            votes=None if votes == MISSING_VOTES else int(votes),
+        )
+
+    def rows(self, indices=None):
+        """
+        Restituisce i film alle posizioni indicate (tutti se None).
+
+        Args:
+            indices (Iterable[int] | numpy.ndarray | None): posizioni
+
+        Yields:
+            Film: un film alla volta
+        """
+        if indices is None:
+            indices = range(len(self))
+        for i in indices:
+            yield self.film(i)
+
+    # --- ordinamenti -----------------------------------------------------
+
+    def sort_by(self, field, descending=False):
+        """
+        Posizioni dei film ordinate per un campo.
+
+        Args:
+            field (str): "title", "year", "minutes", "rating" o "votes"
+            descending (bool): ordine decrescente
+
+        Returns:
+            numpy.ndarray: posizioni ordinate
+        """
+        if field == "title":
+            return self.title_order[::-1] if descending else self.title_order
+        values = {"year": self.year, "minutes": self.minutes,
+                  "rating": self.rating10, "votes": self.votes}[field]
+        if descending:
+            values = -values.astype(np.int64)
+        return np.argsort(values, kind="stable")
+
+    # --- filtri ----------------------------------------------------------
+
+    def longer_than(self, min_minutes=120):
+        """Posizioni dei film con durata >= `min_minutes`."""
+        return np.flatnonzero(self.minutes >= min_minutes)
+
+    def rated_above(self, threshold=7.5):
+        """Posizioni dei film con rating strettamente superiore a `threshold`."""
+        return np.flatnonzero(self.rating10 > round(threshold * 10, 6))
+
+    def with_mpa(self, mpa):
+        """Posizioni dei film con la classificazione MPA indicata (dall'indice dei gruppi)."""
+        return self.mpa.rows(mpa)
+
+    def with_year(self, year):
+        """Posizioni dei film dell'anno indicato (dall'indice dei gruppi)."""
+        return self.year_index.rows(year)
+
+    # --- raggruppamenti --------------------------------------------------
+
+    def mpa_counts(self):
+        """
+        Totale dei film per MPA.
+
+        Returns:
+            dict[str, int]: conteggi, dal più frequente
+        """
+        return {mpa or EMPTY_MPA: count for mpa, count in self.mpa.value_counts().items()}
@@ -0,0 +1,90 @@
+"""
+Parsing "scalare" (un valore alla volta) dei campi del dataset IMDb.
+
+Queste funzioni non dipendono da pandas: sono usate dal motore in streaming
+e da tutti i percorsi che leggono il CSV riga per riga.
+"""
+import re
+
+# Intestazione attesa del file imdb_movies_2024.csv
+COLUMNS = ("Title", "Movie Link", "Year", "Duration", "MPA", "Rating", "Votes")
+
+# "1. Inside Out 2" -> "Inside Out 2"
+_RANK_PREFIX = re.compile(r"^\d+\.\s*")
+
+# "1h 36m", "2h", "55m"
+_DURATION = re.compile(r"^\s*(?:(\d+)h)?\s*(?:(\d+)m)?\s*$")
+
+
+def strip_rank(title):
+    """
+    Rimuove il numero di classifica iniziale dal titolo.
+
+    Args:
+        title (str): titolo originale (es. "1. Inside Out 2")
+
+    Returns:
+        str: titolo senza prefisso (es. "Inside Out 2")
+    """
+    return _RANK_PREFIX.sub("", title).strip()
+
+
+def duration_to_minutes(text):
+    """
+    Converte una durata testuale ("1h 36m", "2h", "55m") in minuti.
+
+    Args:
+        text (str): durata così come compare nel CSV
+
+    Returns:
+        int | None: minuti totali, None se il valore è vuoto o non valido
+    """
+    if not text:
+        return None
+    match = _DURATION.match(text)
+    if match is None or not (match.group(1) or match.group(2)):
+        return None
+    hours = int(match.group(1) or 0)
+    minutes = int(match.group(2) or 0)
+    return hours * 60 + minutes
+
+
+def parse_rating(text):
+    """
+    Converte il rating in float.
+
+    Args:
+        text (str): rating testuale (es. "7.6")
+
+    Returns:
+        float | None: rating, None se mancante o non numerico
+    """
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return None
+
+
+_VOTE_MULTIPLIERS = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+
+
+def parse_votes(text):
+    """
+    Converte il numero di voti ("194K", "1.5K", "22", "1,234") in intero.
+
+    Args:
+        text (str): numero di voti così come compare nel CSV
+
+    Returns:
+        int | None: numero di voti, None se mancante o non valido
+    """
+    if not text:
+        return None
+    text = text.strip().replace(",", "").upper()
+    multiplier = _VOTE_MULTIPLIERS.get(text[-1:], 1)
+    if multiplier != 1:
+        text = text[:-1]
+    try:
+        return round(float(text) * multiplier)
+    except ValueError:
+        return None
@@ -0,0 +1,139 @@
+"""
+Grafico della distribuzione dei rating, senza finestra e con cache.
+
+`plot_rating_distribution` di Salvatore Viganò importa seaborn/matplotlib
+all'avvio del modulo, ricalcola la KDE a ogni esecuzione e chiama
+`plt.show()`. Qui:
+- matplotlib viene importato solo quando serve davvero disegnare; la
+  figura è una `Figure` con il proprio canvas Agg, senza pyplot e senza
+  toccare il backend globale (nessuna finestra, adatto ai job batch);
+- l'istogramma è calcolato con `np.histogram` e passato già pronto al
+  grafico;
+- la KDE gaussiana è calcolata con NumPy su un campione di al massimo
+  `kde_samples` valori, così il costo non cresce con il dataset;
+- il PNG viene salvato in `.imdb_cache/plots/` con la firma del CSV
+  (`signature.py`) nel nome: se il file non è cambiato si riusa
+  l'immagine senza importare matplotlib.
+
+Esempio:
+    png = plot_rating_distribution("imdb_movies_2024.csv", "rating_distribution.png")
+"""
+import os
+import shutil
+
+import numpy as np
+
+from .cache import CACHE_DIR, load_columns
+from .signature import dataset_signature
+
+PLOTS_DIR = "plots"
+
+DEFAULT_BINS = 20
+# oltre questo numero di valori la KDE si calcola su un campione
+DEFAULT_KDE_SAMPLES = 5_000
+KDE_POINTS = 200
+
+
+def rating_histogram(ratings, bins=DEFAULT_BINS):
+    """
+    Istogramma dei rating validi (i NaN sono esclusi).
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: conteggi e bordi degli intervalli
+    """
+    ratings = np.asarray(ratings, dtype=np.float64)
+    return np.histogram(ratings[~np.isnan(ratings)], bins=bins)
+
+
+def kde_curve(ratings, points=KDE_POINTS, max_samples=DEFAULT_KDE_SAMPLES, seed=0):
+    """
+    Stima gaussiana della densità (banda di Scott), su un campione casuale
+    se i valori sono più di `max_samples`.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray] | None: ascisse e densità, None
+        se i valori validi sono meno di due o tutti uguali
+    """
+    ratings = np.asarray(ratings, dtype=np.float64)
+    ratings = ratings[~np.isnan(ratings)]
+    if len(ratings) > max_samples:
+        ratings = np.random.default_rng(seed).choice(ratings, max_samples, replace=False)
+
+    std = ratings.std(ddof=1) if len(ratings) > 1 else 0.0
+    if std == 0:
+        return None
+
+    bandwidth = std * len(ratings) ** (-1 / 5)
+    xs = np.linspace(ratings.min() - 3 * bandwidth, ratings.max() + 3 * bandwidth, points)
+    # matrice punti x campioni: memoria O(points * max_samples)
+    density = np.exp(-0.5 * ((xs[:, None] - ratings[None, :]) / bandwidth) ** 2).sum(axis=1)
+    density /= len(ratings) * bandwidth * np.sqrt(2 * np.pi)
+    return xs, density
+
+
+def render_histogram(counts, edges, curve, output_path):
+    """Disegna l'istogramma (e la curva KDE scalata sui conteggi) in un PNG."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(10, 6))
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    ax.stairs(counts, edges, fill=True, alpha=0.6, edgecolor="black")
+    if curve is not None:
+        xs, density = curve
+        ax.plot(xs, density * counts.sum() * np.diff(edges).mean())
+    ax.set_title("Distribution of Movie Ratings")
+    ax.set_xlabel("Rating")
+    ax.set_ylabel("Frequency")
+    figure.savefig(output_path, format="png")
+
+
+def plot_path(file_path, bins=DEFAULT_BINS, kde=True):
+    """PNG in cache per il CSV e le opzioni indicate."""
+    folder, name = os.path.split(os.path.abspath(file_path))
+    variant = f"b{bins}" + ("-kde" if kde else "")
+    return os.path.join(folder, CACHE_DIR, PLOTS_DIR,
+                        f"{name}-{dataset_signature(file_path)}-rating-{variant}.png")
+
+
+def plot_rating_distribution(file_path, output_path=None, bins=DEFAULT_BINS, kde=True,
+                             kde_samples=DEFAULT_KDE_SAMPLES, refresh=False):
+    """
+    Produce il grafico della distribuzione dei rating, riusando il PNG in
+    cache se il CSV non è cambiato.
+
+    Args:
+        file_path (str): percorso del CSV
+        output_path (str | None): copia il PNG anche qui
+        bins (int): numero di intervalli dell'istogramma
+        kde (bool): aggiunge la curva di densità
+        kde_samples (int): valori massimi usati per la KDE
+        refresh (bool): ridisegna anche se il PNG è in cache
+
+    Returns:
+        str: percorso del PNG (output_path se indicato)
+    """
+    cached = plot_path(file_path, bins, kde)
+    if refresh or not os.path.exists(cached):
+        ratings = load_columns(file_path)["rating"]
+        counts, edges = rating_histogram(ratings, bins)
+        curve = kde_curve(ratings, max_samples=kde_samples) if kde else None
+
+        folder = os.path.dirname(cached)
+        os.makedirs(folder, exist_ok=True)
+        # le immagini di versioni precedenti dello stesso file non servono più
+        prefix = os.path.basename(file_path) + "-"
+        signature = dataset_signature(file_path)
+        for entry in os.listdir(folder):
+            if entry.startswith(prefix) and not entry.startswith(prefix + signature):
+                os.remove(os.path.join(folder, entry))
+
+        staging = cached + ".tmp"
+        render_histogram(counts, edges, curve, staging)
+        os.replace(staging, cached)
+
+    if output_path is None:
+        return cached
+    shutil.copyfile(cached, output_path)
+    return output_path
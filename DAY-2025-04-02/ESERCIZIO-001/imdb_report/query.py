@@ -0,0 +1,266 @@
+"""
+Query "pigre" sul dataset IMDb.
+
+Ogni funzione di film_filter.py rilegge il file, filtra e salva per conto
+suo. Qui una query si costruisce a pezzi e non fa nulla finché non viene
+eseguita; all'esecuzione il CSV viene letto una sola volta e:
+- i filtri vengono valutati subito sulla riga grezza, convertendo solo i
+  campi che servono ai filtri (predicate pushdown);
+- solo le righe che passano i filtri vengono convertite, e solo nelle
+  colonne richieste da `select` / `order_by`;
+- `order_by` + `limit` usa un heap di dimensione `limit` invece di
+  ordinare tutte le righe.
+
+Esempio:
+    from imdb_report.query import Movies, minutes, rating, title, title_key
+
+    best_long = (
+        Movies.scan("imdb_movies_2024.csv")
+        .where(rating > 7.5)
+        .where(minutes >= 120)
+        .order_by(title_key)
+        .select(title, rating, minutes)
+    )
+    print(best_long.explain())
+    rows = best_long.collect()
+"""
+import csv
+import heapq
+import operator
+from itertools import count, islice
+
+from .parsing import COLUMNS, duration_to_minutes, parse_rating, parse_votes, strip_rank
+from .stream import raw_fields
+from .titles import title_key as make_title_key
+
+# colonna logica -> (posizione del campo grezzo in COLUMNS, conversione)
+_FIELDS = {
+    "title": (0, strip_rank),
+    "title_key": (0, make_title_key),
+    "link": (1, str),
+    "year": (2, lambda text: int(text) if text.isdigit() else None),
+    "minutes": (3, duration_to_minutes),
+    "mpa": (4, str.strip),
+    "rating": (5, parse_rating),
+    "votes": (6, parse_votes),
+}
+
+_SYMBOLS = {
+    operator.gt: ">", operator.ge: ">=", operator.lt: "<",
+    operator.le: "<=", operator.eq: "==", operator.ne: "!=",
+}
+
+
+class Column:
+    """Riferimento a una colonna; i confronti producono un `Predicate`."""
+
+    def __init__(self, name):
+        if name not in _FIELDS:
+            raise ValueError(f"Colonna sconosciuta: {name}")
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+    def _compare(self, op, value):
+        return Predicate(self, op, value)
+
+    def __gt__(self, value):
+        return self._compare(operator.gt, value)
+
+    def __ge__(self, value):
+        return self._compare(operator.ge, value)
+
+    def __lt__(self, value):
+        return self._compare(operator.lt, value)
+
+    def __le__(self, value):
+        return self._compare(operator.le, value)
+
+    def __eq__(self, value):
+        return self._compare(operator.eq, value)
+
+    def __ne__(self, value):
+        return self._compare(operator.ne, value)
+
+    __hash__ = object.__hash__
+
+    def isin(self, values):
+        return Predicate(self, lambda left, right: left in right, frozenset(values), "in")
+
+
+class Predicate:
+    """Condizione su una colonna; i valori mancanti (None) non la soddisfano mai."""
+
+    def __init__(self, column, op, value, symbol=None):
+        self.column = column
+        self.op = op
+        self.value = value
+        self.symbol = symbol or _SYMBOLS.get(op, "?")
+
+    def __repr__(self):
+        return f"{self.column} {self.symbol} {self.value!r}"
+
+    def __call__(self, value):
+        return value is not None and self.op(value, self.value)
+
+
+# colonne predefinite, da usare direttamente nelle query
+title = Column("title")
+title_key = Column("title_key")
+link = Column("link")
+year = Column("year")
+minutes = Column("minutes")
+mpa = Column("mpa")
+rating = Column("rating")
+votes = Column("votes")
+
+
+class Movies:
+    """Piano di una query; ogni metodo restituisce un nuovo piano."""
+
+    def __init__(self, file_path, predicates=(), columns=None, order=None, descending=False,
+                 limit=None, encoding="utf-8"):
+        self.file_path = file_path
+        self.predicates = tuple(predicates)
+        self.columns = columns
+        self.order = order
+        self.descending = descending
+        self.limit_rows = limit
+        self.encoding = encoding
+
+    @classmethod
+    def scan(cls, file_path, encoding="utf-8"):
+        """Inizia una query sul CSV indicato (nessuna lettura avviene qui)."""
+        return cls(file_path, encoding=encoding)
+
+    def _replace(self, **changes):
+        state = dict(
+            file_path=self.file_path, predicates=self.predicates, columns=self.columns,
+            order=self.order, descending=self.descending, limit=self.limit_rows,
+            encoding=self.encoding,
+        )
+        state.update(changes)
+        return Movies(**state)
+
+    # --- costruzione del piano -------------------------------------------
+
+    def where(self, predicate):
+        """Aggiunge un filtro (in AND con i precedenti)."""
+        return self._replace(predicates=self.predicates + (predicate,))
+
+    def select(self, *columns):
+        """Colonne da restituire (default: tutte tranne title_key)."""
+        return self._replace(columns=tuple(columns))
+
+    def order_by(self, column, descending=False):
+        """Ordina il risultato per una colonna."""
+        return self._replace(order=column, descending=descending)
+
+    def limit(self, rows):
+        """Restituisce al massimo `rows` righe."""
+        return self._replace(limit=rows)
+
+    # --- esecuzione ------------------------------------------------------
+
+    def _output_names(self):
+        if self.columns is None:
+            return [name for name in _FIELDS if name != "title_key"]
+        return [column.name for column in self.columns]
+
+    def explain(self):
+        """Descrizione testuale del piano di esecuzione."""
+        filter_names = sorted({predicate.column.name for predicate in self.predicates})
+        lines = [f"SCAN {self.file_path}"]
+        if self.predicates:
+            lines.append(f"  FILTER (sulla riga grezza, converte: {', '.join(filter_names)}) "
+                         + " AND ".join(map(repr, self.predicates)))
+        lines.append(f"  PROJECT {', '.join(self._output_names())}")
+        if self.order is not None:
+            direction = "DESC" if self.descending else "ASC"
+            how = f"TOP {self.limit_rows} (heap)" if self.limit_rows is not None else "SORT"
+            lines.append(f"  {how} BY {self.order} {direction}")
+        elif self.limit_rows is not None:
+            lines.append(f"  LIMIT {self.limit_rows} (lettura interrotta appena raggiunto)")
+        return "\n".join(lines)
+
+    def _scan(self):
+        """Righe che soddisfano i filtri: coppie (chiave di ordinamento, riga)."""
+        checks = [(_FIELDS[p.column.name], p) for p in self.predicates]
+        outputs = [(name, _FIELDS[name]) for name in self._output_names()]
+        sort_field = _FIELDS[self.order.name] if self.order is not None else None
+
+        with open(self.file_path, newline="", encoding=self.encoding) as csv_file:
+            reader = csv.reader(csv_file)
+            header = [name.strip() for name in next(reader, [])]
+            positions = tuple(header.index(name) for name in COLUMNS)
+
+            for row in reader:
+                if not row:
+                    continue
+                fields = raw_fields(row, positions)
+                if all(predicate(convert(fields[i])) for (i, convert), predicate in checks):
+                    record = {name: convert(fields[i]) for name, (i, convert) in outputs}
+                    key = sort_field[1](fields[sort_field[0]]) if sort_field else None
+                    yield key, record
+
+    def collect(self):
+        """
+        Esegue la query.
+
+        Returns:
+            list[dict]: righe risultanti con le colonne selezionate
+        """
+        rows = self._scan()
+        if self.order is None:
+            if self.limit_rows is None:
+                return [record for _, record in rows]
+            return [record for _, record in islice(rows, self.limit_rows)]
+
+        # i valori mancanti finiscono sempre in fondo
+        tie = count()
+        sign = -1 if self.descending else 1
+        keyed = (((key is None, _signed(key, sign)), next(tie), record) for key, record in rows)
+        if self.limit_rows is not None:
+            best = heapq.nsmallest(self.limit_rows, keyed, key=operator.itemgetter(0, 1))
+        else:
+            best = sorted(keyed, key=operator.itemgetter(0, 1))
+        return [record for _, _, record in best]
+
+    def count(self):
+        """
+        Numero di righe che soddisfano i filtri (al massimo `limit`), senza
+        materializzarle; con `limit` la lettura si ferma appena raggiunto.
+        """
+        rows = self._replace(columns=(), order=None)._scan()
+        if self.limit_rows is not None:
+            rows = islice(rows, self.limit_rows)
+        return sum(1 for _ in rows)
+
+    def to_frame(self):
+        """Esegue la query e restituisce un DataFrame pandas."""
+        import pandas as pd
+
+        return pd.DataFrame(self.collect(), columns=self._output_names())
+
+
+def _signed(key, sign):
+    # numeri: si inverte il segno; testi: ordine inverso tramite _Reversed
+    if key is None or sign == 1:
+        return key if key is not None else 0
+    return -key if isinstance(key, (int, float)) else _Reversed(key)
+
+
+class _Reversed:
+    """Avvolge un valore invertendone l'ordinamento (per DESC sui testi)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return self.value > other.value
+
+    def __eq__(self, other):
+        return self.value == other.value
@@ -0,0 +1,107 @@
+"""
+Stadio di validazione e riallineamento delle righe "scivolate" (versione
+vettoriale per DataFrame).
+
+Ogni cella delle colonne FIELDS viene classificata con le espressioni
+regolari di `alignment.py` applicate a colonne intere; le righe non
+allineate vengono raggruppate per firma (maschere dei tipi) e spostate in
+blocco. Il lavoro Python è proporzionale al numero di firme distinte, non
+al numero di righe.
+"""
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from .alignment import FIELDS, MPA, PATTERNS, SLOT_BITS, slot_mapping
+
+
+class RepairResult(NamedTuple):
+    frame: pd.DataFrame
+    # righe spostate nelle colonne corrette
+    repaired: np.ndarray
+    # righe non allineate per cui non esiste una ricollocazione valida
+    unrepairable: np.ndarray
+
+
+def read_raw(file_path, **kwargs):
+    """
+    Legge il CSV lasciando tutti i campi come testo: la classificazione
+    lavora sulle stringhe originali (un anno letto come float diventerebbe
+    "2024.0").
+
+    Args:
+        file_path (str): percorso del CSV
+
+    Returns:
+        pandas.DataFrame: dati grezzi, stringa vuota per i campi mancanti
+    """
+    return pd.read_csv(file_path, dtype=str, keep_default_na=False, **kwargs)
+
+
+def classify(frame):
+    """
+    Calcola la maschera dei tipi per ogni cella delle colonne FIELDS.
+
+    Args:
+        frame (pandas.DataFrame): dati grezzi
+
+    Returns:
+        numpy.ndarray: matrice uint8 (righe x len(FIELDS))
+    """
+    masks = np.zeros((len(frame), len(FIELDS)), dtype=np.uint8)
+    for j, name in enumerate(FIELDS):
+        text = frame[name].astype("string").fillna("").str.strip()
+        column = masks[:, j]
+        for bit, pattern in PATTERNS.items():
+            column |= text.str.match(pattern).to_numpy(dtype=bool) * np.uint8(bit)
+        # non vuoto e nessun tipo numerico riconosciuto -> MPA
+        column[(column == 0) & (text != "").to_numpy(dtype=bool)] = MPA
+    return masks
+
+
+def realign_shifted_rows(frame, inplace=False):
+    """
+    Individua le righe con campi scivolati e li ricolloca nelle colonne giuste.
+
+    Args:
+        frame (pandas.DataFrame): dati letti con `read_raw`
+        inplace (bool): se False lavora su una copia
+
+    Returns:
+        RepairResult: DataFrame corretto e maschere delle righe riparate /
+        non riparabili
+    """
+    if not inplace:
+        frame = frame.copy()
+
+    masks = classify(frame)
+    slots = np.array(SLOT_BITS, dtype=np.uint8)
+    aligned = ((masks & slots) != 0) | (masks == 0)
+    bad = np.flatnonzero(~aligned.all(axis=1))
+
+    repaired = np.zeros(len(frame), dtype=bool)
+    unrepairable = np.zeros(len(frame), dtype=bool)
+    if len(bad) == 0:
+        return RepairResult(frame, repaired, unrepairable)
+
+    values = frame[list(FIELDS)].to_numpy(dtype=object)[bad]
+    fixed = np.full_like(values, "", dtype=object)
+    signatures, groups = np.unique(masks[bad], axis=0, return_inverse=True)
+    groups = groups.reshape(-1)
+
+    for g, signature in enumerate(signatures):
+        rows = groups == g
+        mapping = slot_mapping(tuple(int(m) for m in signature))
+        if mapping is None:
+            # riga lasciata com'è
+            fixed[rows] = values[rows]
+            unrepairable[bad[rows]] = True
+            continue
+        for source, target in mapping:
+            fixed[rows, target] = values[rows, source]
+        repaired[bad[rows]] = True
+
+    positions = [frame.columns.get_loc(name) for name in FIELDS]
+    frame.iloc[bad, positions] = fixed
+    return RepairResult(frame, repaired, unrepairable)
@@ -0,0 +1,169 @@
+"""
+Conteggi veloci sul CSV grezzo tramite memory-map.
+
+Per domande come "quanti film durano almeno 2h" o "quanti hanno rating
+superiore a 7.5" il percorso con `csv.DictReader` (Gianluca Daidone)
+decodifica ogni riga e crea un dizionario. Qui il file viene aperto con
+`mmap` e letto a blocchi di byte; per ogni riga:
+- i campi da Year in poi vengono separati partendo da destra
+  (`bytes.rsplit`), così le virgole nei titoli tra virgolette non danno
+  fastidio e Title/Movie Link non vengono mai toccati;
+- durata e rating vengono interpretati direttamente sui byte, senza
+  decodifica e senza oggetti per riga oltre ai pochi campi necessari.
+
+Le righe "sospette" (campi tra virgolette a destra del titolo, righe
+scivolate, valori non riconosciuti) passano dal percorso normale
+(`stream.parse_row`), quindi i conteggi coincidono con quelli del motore in
+streaming.
+
+Esempio:
+    counts = scan_counts("imdb_movies_2024.csv")
+    print(counts.long_movies, counts.high_rating)
+"""
+import csv
+import mmap
+import re
+from typing import NamedTuple
+
+from .parsing import COLUMNS
+from .stream import parse_row
+
+# byte letti per blocco dal memory-map
+BLOCK_SIZE = 16 * 1024 * 1024
+
+_DURATION = re.compile(rb"^\s*(?:(\d+)h)?\s*(?:(\d+)m)?\s*$")
+
+
+class ScanCounts(NamedTuple):
+    rows: int
+    # film con durata >= min_minutes
+    long_movies: int
+    # film con rating strettamente superiore alla soglia
+    high_rating: int
+
+
+def _minutes(field):
+    """Minuti di una durata in byte; None se vuota, False se non valida."""
+    if not field:
+        return None
+    match = _DURATION.match(field)
+    if match is None or not (match.group(1) or match.group(2)):
+        return False
+    return int(match.group(1) or 0) * 60 + int(match.group(2) or 0)
+
+
+def _rating(field):
+    """Rating di un campo in byte; None se vuoto, False se non valido."""
+    if not field:
+        return None
+    try:
+        return float(field)
+    except ValueError:
+        return False
+
+
+def _layout(header_line, encoding):
+    """
+    Posizioni delle colonne e indici da destra di Year, Duration, MPA e Rating.
+
+    Returns:
+        tuple[tuple[int, ...], int, tuple[int, int, int, int]]: posizioni di
+        COLUMNS nella riga, numero di separazioni da destra, indici nei pezzi
+    """
+    header = [name.strip() for name in next(csv.reader([header_line.decode(encoding)]))]
+    try:
+        positions = tuple(header.index(name) for name in COLUMNS)
+    except ValueError as e:
+        raise ValueError(f"Intestazione non valida: {header}") from e
+
+    year, duration, mpa, rating = positions[2:6]
+    first = min(year, duration, mpa, rating)
+    if first <= max(positions[0], positions[1]):
+        raise ValueError("Year, Duration, MPA e Rating devono seguire Title e Movie Link")
+    # rsplit in (len(header) - first) separazioni: il pezzo 0 contiene Title e Link
+    splits = len(header) - first
+    return positions, splits, tuple(i - first + 1 for i in (year, duration, mpa, rating))
+
+
+def scan_counts(file_path, min_minutes=120, rating_above=7.5, encoding="utf-8"):
+    """
+    Conta in una sola passata le righe, i film lunghi e quelli con rating alto.
+
+    Args:
+        file_path (str): percorso del CSV
+        min_minutes (int): durata minima (inclusa) dei film lunghi
+        rating_above (float): soglia (esclusa) del rating
+        encoding (str): codifica del file (solo per le righe sospette)
+
+    Returns:
+        ScanCounts: conteggi
+    """
+    rows = long_movies = high_rating = 0
+    # durate e rating hanno pochi valori distinti: si interpretano una volta sola
+    durations, ratings = {}, {}
+
+    with open(file_path, "rb") as raw:
+        header_line = raw.readline()
+        data_start = raw.tell()
+        positions, splits, (i_year, i_duration, i_mpa, i_rating) = _layout(header_line, encoding)
+        if data_start >= raw.seek(0, 2):
+            return ScanCounts(0, 0, 0)
+
+        with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            size = len(data)
+            start = data_start
+            while start < size:
+                end = data.rfind(b"\n", start, min(start + BLOCK_SIZE, size)) + 1
+                if end <= start:
+                    # riga più lunga del blocco, o ultima riga senza "a capo"
+                    newline = data.find(b"\n", start)
+                    end = size if newline < 0 else newline + 1
+                lines = data[start:end].split(b"\n")
+                start = end
+
+                for line in lines:
+                    if line.endswith(b"\r"):
+                        line = line[:-1]
+                    if not line:
+                        continue
+                    rows += 1
+
+                    parts = line.rsplit(b",", splits)
+                    if len(parts) == splits + 1 and b'"' not in line[len(parts[0]):]:
+                        year, mpa = parts[i_year], parts[i_mpa]
+                        field = parts[i_duration]
+                        minutes = durations.get(field)
+                        if minutes is None and field not in durations:
+                            minutes = durations[field] = _minutes(field)
+                        field = parts[i_rating]
+                        rating = ratings.get(field)
+                        if rating is None and field not in ratings:
+                            rating = ratings[field] = _rating(field)
+                        # stesso controllo economico di stream.raw_fields
+                        clean = (
+                            year.isdigit() and not mpa[:1].isdigit()
+                            and minutes is not False and rating is not False
+                        )
+                    else:
+                        clean = False
+
+                    if not clean:
+                        movie = parse_row(next(csv.reader([line.decode(encoding)])), positions)
+                        minutes, rating = movie.minutes, movie.rating
+
+                    if minutes is not None and minutes >= min_minutes:
+                        long_movies += 1
+                    if rating is not None and rating > rating_above:
+                        high_rating += 1
+
+    return ScanCounts(rows, long_movies, high_rating)
+
+
+def count_long_movies(file_path, min_minutes=120, encoding="utf-8"):
+    """Numero di film con durata >= `min_minutes`."""
+    return scan_counts(file_path, min_minutes=min_minutes, encoding=encoding).long_movies
+
+
+def count_high_rating(file_path, threshold=7.5, encoding="utf-8"):
+    """Numero di film con rating strettamente superiore a `threshold`."""
+    return scan_counts(file_path, rating_above=threshold, encoding=encoding).high_rating
@@ -0,0 +1,149 @@
+"""
+Caricamento parallelo a blocchi per CSV molto grandi.
+
+Il file viene diviso in blocchi di byte allineati all'inizio di una riga;
+ogni blocco viene elaborato in un processo separato
+(`ProcessPoolExecutor`) con le stesse regole di pulizia del motore in
+streaming (`stream.parse_row`: titolo senza numero, durata, voti,
+riallineamento). Ogni processo restituisce i propri report parziali, che
+vengono poi fusi con `Report.merge`.
+
+Nota: la divisione sulle righe presuppone che i campi tra virgolette non
+contengano "a capo", come nei dump IMDb.
+
+Esempio:
+    reports = run_sharded("imdb_full.csv", workers=8)
+    print(reports["mpa"].result())
+"""
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .parsing import COLUMNS
+from .stream import default_reports, parse_row
+
+# dimensione indicativa di un blocco: abbastanza grande da ammortizzare il
+# costo del processo, abbastanza piccola da limitare la memoria per worker
+DEFAULT_SHARD_SIZE = 64 * 1024 * 1024
+
+
+def read_header(file_path, encoding="utf-8"):
+    """
+    Legge l'intestazione e calcola la posizione di ogni colonna di COLUMNS.
+
+    Returns:
+        tuple[tuple[int, ...], int]: posizioni delle colonne e offset in byte
+        della prima riga di dati
+    """
+    with open(file_path, "rb") as raw:
+        header_line = raw.readline()
+        data_start = raw.tell()
+    header = [name.strip() for name in next(csv.reader([header_line.decode(encoding)]))]
+    try:
+        positions = tuple(header.index(name) for name in COLUMNS)
+    except ValueError as e:
+        raise ValueError(f"Intestazione non valida in {file_path}: {header}") from e
+    return positions, data_start
+
+
+def shard_ranges(file_path, data_start, shard_size=DEFAULT_SHARD_SIZE):
+    """
+    Divide il file in intervalli [inizio, fine) che iniziano e finiscono su
+    un confine di riga.
+
+    Args:
+        file_path (str): percorso del CSV
+        data_start (int): offset della prima riga di dati
+        shard_size (int): dimensione indicativa di un blocco in byte
+
+    Returns:
+        list[tuple[int, int]]: intervalli di byte
+    """
+    size = os.path.getsize(file_path)
+    offsets = [data_start]
+    with open(file_path, "rb") as raw:
+        position = data_start + shard_size
+        while position < size:
+            raw.seek(position)
+            raw.readline()  # si completa la riga in corso
+            boundary = raw.tell()
+            if boundary >= size:
+                break
+            offsets.append(boundary)
+            position = boundary + shard_size
+    offsets.append(size)
+    return [(start, end) for start, end in zip(offsets, offsets[1:]) if end > start]
+
+
+def parse_shard(file_path, start, end, positions, report_factory=default_reports, encoding="utf-8"):
+    """
+    Elabora un blocco del file (eseguita nei processi worker).
+
+    Args:
+        file_path (str): percorso del CSV
+        start (int): offset iniziale del blocco
+        end (int): offset finale (escluso)
+        positions (tuple[int, ...]): posizioni delle colonne di COLUMNS
+        report_factory (Callable[[], dict[str, Report]]): crea i report
+            parziali; deve essere una funzione a livello di modulo
+        encoding (str): codifica del file
+
+    Returns:
+        dict[str, Report]: report parziali del blocco
+    """
+    reports = report_factory()
+    feeders = [report.feed for report in reports.values()]
+
+    with open(file_path, "rb") as raw:
+        raw.seek(start)
+        chunk = raw.read(end - start)
+
+    for row in csv.reader(chunk.decode(encoding).split("\n")):
+        if row:
+            movie = parse_row(row, positions)
+            for feed in feeders:
+                feed(movie)
+    return reports
+
+
+def merge_reports(target, partial):
+    """Fonde i report parziali `partial` in `target` (stesse chiavi)."""
+    for name, report in partial.items():
+        target[name].merge(report)
+    return target
+
+
+def run_sharded(file_path, report_factory=default_reports, workers=None,
+                shard_size=DEFAULT_SHARD_SIZE, encoding="utf-8"):
+    """
+    Esegue i report su tutto il file usando più processi.
+
+    Args:
+        file_path (str): percorso del CSV
+        report_factory (Callable[[], dict[str, Report]]): crea i report
+        workers (int | None): numero di processi (default: numero di core)
+        shard_size (int): dimensione indicativa di un blocco in byte
+        encoding (str): codifica del file
+
+    Returns:
+        dict[str, Report]: report fusi nell'ordine del file
+    """
+    positions, data_start = read_header(file_path, encoding)
+    ranges = shard_ranges(file_path, data_start, shard_size)
+    merged = report_factory()
+
+    if len(ranges) <= 1 or workers == 1:
+        # un solo blocco: non serve pagare l'avvio dei processi
+        for start, end in ranges:
+            merge_reports(merged, parse_shard(file_path, start, end, positions, report_factory, encoding))
+        return merged
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(parse_shard, file_path, start, end, positions, report_factory, encoding)
+            for start, end in ranges
+        ]
+        # i risultati vengono fusi nell'ordine dei blocchi
+        for future in futures:
+            merge_reports(merged, future.result())
+    return merged
@@ -0,0 +1,23 @@
+"""
+Firma di un file di dati, usata per invalidare indici e cache derivati.
+"""
+import hashlib
+import os
+
+
+def dataset_signature(file_path):
+    """
+    Calcola una firma del file basata su dimensione e data di modifica.
+
+    Non legge il contenuto: è immediata anche su file da diversi GB e cambia
+    ogni volta che il CSV viene riscritto.
+
+    Args:
+        file_path (str): percorso del file
+
+    Returns:
+        str: firma esadecimale di 16 caratteri
+    """
+    info = os.stat(file_path)
+    raw = f"{os.path.abspath(file_path)}:{info.st_size}:{info.st_mtime_ns}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
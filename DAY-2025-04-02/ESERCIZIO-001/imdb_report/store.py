@@ -0,0 +1,226 @@
+"""
+Archivio in memoria dei film con aggregati aggiornati in modo incrementale.
+
+Nella soluzione con menù (Claudio Caudullo) ogni aggiunta, modifica o
+cancellazione riscrive l'intero CSV e lo rilegge da capo. Qui invece:
+- i conteggi per MPA, il numero di film >= 2h e l'insieme dei film con
+  rating > 7.5 vengono aggiornati solo per il film toccato;
+- le aggiunte vengono accodate al CSV;
+- modifiche e cancellazioni vengono scritte in un giornale
+  (`<file>.journal`, una riga JSON per operazione) riapplicato al caricamento.
+  `compact()` riscrive il CSV una sola volta e svuota il giornale.
+
+Esempio:
+    store = MovieStore.open("imdb_movies_2024.csv")
+    movie_id = store.add("Nuovo film", "https://...", "2024", "2h 5m", "PG", "7.8", "1K")
+    store.update(movie_id, rating="8.1")
+    store.delete(movie_id)
+"""
+import csv
+import json
+import os
+import re
+from collections import Counter
+
+from .parsing import COLUMNS
+from .stream import EMPTY_MPA, parse_row
+
+JOURNAL_SUFFIX = ".journal"
+
+# nomi dei campi accettati da add/update, nell'ordine di COLUMNS
+FIELD_NAMES = ("title", "link", "year", "duration", "mpa", "rating", "votes")
+
+_POSITIONS = tuple(range(len(COLUMNS)))
+
+_RANK = re.compile(r"^(\d+)\.")
+
+
+class MovieStore:
+    """Film indicizzati per id con conteggi MPA, film lunghi e rating alti sempre aggiornati."""
+
+    def __init__(self, file_path, min_minutes=120, rating_threshold=7.5, encoding="utf-8"):
+        self.file_path = file_path
+        self.journal_path = file_path + JOURNAL_SUFFIX
+        self.min_minutes = min_minutes
+        self.rating_threshold = rating_threshold
+        self.encoding = encoding
+
+        # id -> riga grezza (come nel CSV) e id -> Movie convertito
+        self.rows = {}
+        self.movies = {}
+        self.next_id = 1
+
+        # aggregati incrementali
+        self.mpa_counts = Counter()
+        self.long_movies = 0
+        self.high_rating_ids = set()
+
+    @classmethod
+    def open(cls, file_path, **kwargs):
+        """
+        Carica il CSV e riapplica il giornale delle modifiche.
+
+        Args:
+            file_path (str): percorso del CSV
+
+        Returns:
+            MovieStore: archivio pronto all'uso
+        """
+        store = cls(file_path, **kwargs)
+        with open(file_path, newline="", encoding=store.encoding) as csv_file:
+            reader = csv.reader(csv_file)
+            header = [name.strip() for name in next(reader, [])]
+            positions = tuple(header.index(name) for name in COLUMNS)
+            for row in reader:
+                if row:
+                    store._insert([row[i] if i < len(row) else "" for i in positions])
+
+        if os.path.exists(store.journal_path):
+            with open(store.journal_path, encoding="utf-8") as journal:
+                for line in journal:
+                    store._replay(json.loads(line))
+        return store
+
+    # --- aggregati -------------------------------------------------------
+
+    def _account(self, movie_id, movie, sign):
+        """Aggiunge (sign=1) o toglie (sign=-1) un film dagli aggregati."""
+        mpa = movie.mpa or EMPTY_MPA
+        self.mpa_counts[mpa] += sign
+        if self.mpa_counts[mpa] == 0:
+            del self.mpa_counts[mpa]
+
+        if movie.minutes is not None and movie.minutes >= self.min_minutes:
+            self.long_movies += sign
+
+        if movie.rating is not None and movie.rating > self.rating_threshold:
+            if sign > 0:
+                self.high_rating_ids.add(movie_id)
+            else:
+                self.high_rating_ids.discard(movie_id)
+
+    def mpa_table(self):
+        """Totale dei film per MPA, dal più frequente."""
+        return self.mpa_counts.most_common()
+
+    def high_rating(self):
+        """Film con rating > soglia, dal rating più alto."""
+        movies = (self.movies[movie_id] for movie_id in self.high_rating_ids)
+        return sorted(movies, key=lambda movie: movie.rating, reverse=True)
+
+    # --- operazioni in memoria -------------------------------------------
+
+    def _insert(self, row, movie_id=None):
+        if movie_id is None:
+            movie_id = self.next_id
+        self.next_id = max(self.next_id, movie_id + 1)
+        movie = parse_row(row, _POSITIONS)
+        self.rows[movie_id] = row
+        self.movies[movie_id] = movie
+        self._account(movie_id, movie, 1)
+        return movie_id
+
+    def _remove(self, movie_id):
+        self._account(movie_id, self.movies.pop(movie_id), -1)
+        return self.rows.pop(movie_id)
+
+    def _replay(self, entry):
+        if entry["op"] == "delete":
+            self._remove(entry["id"])
+        elif entry["op"] == "update":
+            self._remove(entry["id"])
+            self._insert(entry["row"], entry["id"])
+
+    def _check(self, movie_id):
+        if movie_id not in self.rows:
+            raise KeyError(f"Film con id {movie_id} non trovato")
+
+    # --- operazioni persistenti ------------------------------------------
+
+    def add(self, title, link, year, duration, mpa, rating, votes):
+        """
+        Aggiunge un film (valori testuali, come nel CSV) e lo accoda al file.
+
+        Returns:
+            int: id del nuovo film
+        """
+        movie_id = self.next_id
+        row = [f"{movie_id}. {title}", link, str(year), duration, mpa, str(rating), str(votes)]
+        self._append_csv(row)
+        return self._insert(row)
+
+    def update(self, movie_id, **fields):
+        """
+        Modifica uno o più campi di un film.
+
+        Args:
+            movie_id (int): id del film
+            **fields: nuovi valori testuali (chiavi di FIELD_NAMES)
+        """
+        self._check(movie_id)
+        unknown = set(fields) - set(FIELD_NAMES)
+        if unknown:
+            raise ValueError(f"Campi non validi: {', '.join(sorted(unknown))}")
+
+        row = list(self.rows[movie_id])
+        for name, value in fields.items():
+            position = FIELD_NAMES.index(name)
+            if name == "title":
+                # si conserva il numero di classifica originale
+                rank = _RANK.match(row[0])
+                value = f"{rank.group(1) if rank else movie_id}. {value}"
+            row[position] = str(value)
+
+        self._append_journal({"op": "update", "id": movie_id, "row": row})
+        self._remove(movie_id)
+        self._insert(row, movie_id)
+
+    def delete(self, movie_id):
+        """
+        Elimina un film.
+
+        Args:
+            movie_id (int): id del film
+        """
+        self._check(movie_id)
+        self._append_journal({"op": "delete", "id": movie_id})
+        self._remove(movie_id)
+
+    def compact(self):
+        """
+        Riscrive il CSV con lo stato attuale e svuota il giornale.
+
+        Gli id vengono rinumerati secondo l'ordine delle righe nel nuovo file.
+        """
+        temp_path = self.file_path + ".tmp"
+        with open(temp_path, "w", newline="", encoding=self.encoding) as csv_file:
+            writer = csv.writer(csv_file, lineterminator="\n")
+            writer.writerow(COLUMNS)
+            writer.writerows(self.rows[movie_id] for movie_id in sorted(self.rows))
+        os.replace(temp_path, self.file_path)
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+        old_ids = sorted(self.rows)
+        new_ids = dict(zip(old_ids, range(1, len(old_ids) + 1)))
+        self.rows = {new_ids[i]: row for i, row in self.rows.items()}
+        self.movies = {new_ids[i]: movie for i, movie in self.movies.items()}
+        self.high_rating_ids = {new_ids[i] for i in self.high_rating_ids}
+        self.next_id = len(old_ids) + 1
+
+    def _append_csv(self, row):
+        # se l'ultima riga non termina con "a capo" la si chiude prima
+        with open(self.file_path, "rb") as raw:
+            raw.seek(0, os.SEEK_END)
+            needs_newline = False
+            if raw.tell() > 0:
+                raw.seek(-1, os.SEEK_END)
+                needs_newline = raw.read(1) != b"\n"
+        with open(self.file_path, "a", newline="", encoding=self.encoding) as csv_file:
+            if needs_newline:
+                csv_file.write("\n")
+            csv.writer(csv_file, lineterminator="\n").writerow(row)
+
+    def _append_journal(self, entry):
+        with open(self.journal_path, "a", encoding="utf-8") as journal:
+            journal.write(json.dumps(entry) + "\n")
@@ -0,0 +1,261 @@
+"""
+Motore in streaming per i quattro task dell'esercizio IMDb.
+
+Il CSV viene letto UNA sola volta: ogni riga viene convertita in un `Movie`
+e passata a tutti i report registrati. In memoria resta solo lo stato dei
+report (contatori, titoli da ordinare, eventuali righe selezionate), mai
+l'intero file: lo stesso codice funziona sul campione da 600 righe e sui
+dump completi di IMDb da diversi GB.
+
+Esempio:
+    reports = default_reports()
+    run_reports("imdb_movies_2024.csv", reports.values())
+    print(reports["mpa"].result())
+"""
+import csv
+from collections import Counter
+from typing import NamedTuple
+
+from .alignment import realign_fields
+from .parsing import COLUMNS, duration_to_minutes, parse_rating, parse_votes, strip_rank
+from .titles import title_key
+
+# Etichetta usata per i film senza classificazione MPA
+EMPTY_MPA = "Empty"
+
+
+class Movie(NamedTuple):
+    """Riga del CSV già ripulita e convertita nei tipi corretti."""
+    title: str
+    link: str
+    year: int | None
+    minutes: int | None
+    mpa: str
+    rating: float | None
+    votes: int | None
+
+
+def _split_row(row, positions):
+    """
+    Campi testuali della riga (vedi `raw_fields`) più durata in minuti e
+    rating già convertiti: il controllo economico li deve comunque
+    interpretare, così `parse_row` non li converte una seconda volta.
+    """
+    title, link, year, duration, mpa, rating, votes = (
+        row[i] if i < len(row) else "" for i in positions
+    )
+    minutes = duration_to_minutes(duration)
+    score = parse_rating(rating) if rating else None
+    # controllo economico: solo le righe sospette passano dal riallineamento
+    if (
+        not year.isdigit()
+        or mpa[:1].isdigit()
+        or (duration and minutes is None)
+        or (rating and score is None)
+    ):
+        year, duration, mpa, rating, votes = realign_fields((year, duration, mpa, rating, votes))
+        minutes = duration_to_minutes(duration)
+        score = parse_rating(rating)
+    return title, link, year, duration, mpa, rating, votes, minutes, score
+
+
+def raw_fields(row, positions):
+    """
+    Estrae i campi testuali di una riga nell'ordine di COLUMNS, riallineando
+    quelli scivolati a sinistra (vedi `alignment.py`).
+
+    Args:
+        row (list[str]): campi della riga
+        positions (tuple[int, ...]): indice di ogni colonna di COLUMNS nella riga
+
+    Returns:
+        tuple[str, ...]: title, link, year, duration, mpa, rating, votes
+    """
+    return _split_row(row, positions)[:7]
+
+
+def parse_row(row, positions):
+    """
+    Converte una riga grezza del csv.reader in un `Movie`.
+
+    Args:
+        row (list[str]): campi della riga
+        positions (tuple[int, ...]): indice di ogni colonna di COLUMNS nella riga
+
+    Returns:
+        Movie: riga convertita
+    """
+    title, link, year, _, mpa, _, votes, minutes, rating = _split_row(row, positions)
+    return Movie(
+        title=strip_rank(title),
+        link=link,
+        year=int(year) if year.isdigit() else None,
+        minutes=minutes,
+        mpa=mpa.strip(),
+        rating=rating,
+        votes=parse_votes(votes),
+    )
+
+
+def iter_movies(file_path, encoding="utf-8"):
+    """
+    Legge il CSV riga per riga restituendo un `Movie` alla volta.
+
+    Args:
+        file_path (str): percorso del CSV
+        encoding (str): codifica del file
+
+    Yields:
+        Movie: una riga convertita
+    """
+    with open(file_path, newline="", encoding=encoding) as csv_file:
+        reader = csv.reader(csv_file)
+        header = [name.strip() for name in next(reader, [])]
+        try:
+            positions = tuple(header.index(name) for name in COLUMNS)
+        except ValueError as e:
+            raise ValueError(f"Intestazione non valida in {file_path}: {header}") from e
+
+        for row in reader:
+            if row:
+                yield parse_row(row, positions)
+
+
+class Report:
+    """
+    Interfaccia comune dei report: `feed` riceve un film alla volta,
+    `result` restituisce il risultato finale, `merge` fonde nel report un
+    report parziale dello stesso tipo calcolato su un'altra porzione del
+    file (quella successiva, per i report che conservano l'ordine).
+    """
+
+    def feed(self, movie):
+        raise NotImplementedError
+
+    def merge(self, other):
+        raise NotImplementedError
+
+    def result(self):
+        raise NotImplementedError
+
+
+class TitleSortReport(Report):
+    """Lista dei titoli (senza numero di classifica) in ordine alfabetico naturale."""
+
+    def __init__(self):
+        # si tengono solo i titoli, non le righe complete
+        self.titles = []
+
+    def feed(self, movie):
+        self.titles.append(movie.title)
+
+    def merge(self, other):
+        self.titles.extend(other.titles)
+
+    def result(self):
+        return sorted(self.titles, key=title_key)
+
+
+class LongMovieCount(Report):
+    """Numero di film con durata >= `min_minutes` (default 2h)."""
+
+    def __init__(self, min_minutes=120):
+        self.min_minutes = min_minutes
+        self.count = 0
+
+    def feed(self, movie):
+        if movie.minutes is not None and movie.minutes >= self.min_minutes:
+            self.count += 1
+
+    def merge(self, other):
+        self.count += other.count
+
+    def result(self):
+        return self.count
+
+
+class MpaTable(Report):
+    """Totale dei film raggruppati per classificazione MPA."""
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def feed(self, movie):
+        self.counts[movie.mpa or EMPTY_MPA] += 1
+
+    def merge(self, other):
+        self.counts.update(other.counts)
+
+    def result(self):
+        return self.counts.most_common()
+
+
+class HighRatingReport(Report):
+    """
+    Film con rating strettamente superiore a `threshold`.
+
+    Se viene passato `sink` (una funzione che riceve un `Movie`) i film
+    selezionati vengono inoltrati subito e non restano in memoria.
+    """
+
+    def __init__(self, threshold=7.5, sink=None):
+        self.threshold = threshold
+        self.sink = sink
+        self.count = 0
+        self.movies = []
+
+    def feed(self, movie):
+        if movie.rating is None or movie.rating <= self.threshold:
+            return
+        self.count += 1
+        if self.sink is not None:
+            self.sink(movie)
+        else:
+            self.movies.append(movie)
+
+    def merge(self, other):
+        self.count += other.count
+        if self.sink is not None:
+            for movie in other.movies:
+                self.sink(movie)
+        else:
+            self.movies.extend(other.movies)
+
+    def result(self):
+        return self.movies
+
+
+def default_reports():
+    """
+    Crea i report dei quattro task della traccia.
+
+    Returns:
+        dict[str, Report]: report indicizzati per nome
+    """
+    return {
+        "titles": TitleSortReport(),
+        "long_movies": LongMovieCount(),
+        "mpa": MpaTable(),
+        "high_rating": HighRatingReport(),
+    }
+
+
+def run_reports(file_path, reports, encoding="utf-8"):
+    """
+    Legge il CSV una sola volta e alimenta tutti i report.
+
+    Args:
+        file_path (str): percorso del CSV
+        reports (Iterable[Report]): report da alimentare
+        encoding (str): codifica del file
+
+    Returns:
+        int: numero di righe lette
+    """
+    feeders = [report.feed for report in reports]
+    rows = 0
+    for movie in iter_movies(file_path, encoding):
+        rows += 1
+        for feed in feeders:
+            feed(movie)
+    return rows
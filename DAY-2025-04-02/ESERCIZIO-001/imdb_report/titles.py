@@ -0,0 +1,121 @@
+"""
+Chiave di ordinamento normalizzata per i titoli e indice di ordinamento
+persistente.
+
+La "difficoltà" della traccia è il numero di classifica davanti al titolo
+("1. Inside Out 2"). Qui la chiave viene calcolata una volta sola:
+- rimozione del numero di classifica e degli articoli iniziali (The, A, An)
+- casefold
+- numeri riempiti con zeri, così "Rocky 2" < "Rocky 10" anche con il
+  semplice confronto tra stringhe (ordinamento naturale)
+
+L'ordine risultante viene salvato accanto al CSV (`<file>.titles.idx`):
+le successive liste ordinate sono una semplice scansione dell'indice.
+"""
+import re
+from array import array
+
+from .parsing import strip_rank
+from .signature import dataset_signature
+
+_ARTICLE = re.compile(r"^(?:the|a|an)\s+", re.IGNORECASE)
+_NUMBER = re.compile(r"\d+")
+
+# cifre usate per i numeri nella chiave: basta per qualsiasi anno/sequel
+NUMBER_WIDTH = 10
+
+INDEX_SUFFIX = ".titles.idx"
+_MAGIC = b"IMDBTITLES"
+
+
+def title_key(title):
+    """
+    Calcola la chiave di ordinamento normalizzata di un titolo.
+
+    Args:
+        title (str): titolo, con o senza numero di classifica
+
+    Returns:
+        str: chiave confrontabile con il normale ordinamento tra stringhe
+    """
+    key = _ARTICLE.sub("", strip_rank(title)).casefold()
+    return _NUMBER.sub(lambda m: m.group().zfill(NUMBER_WIDTH), key)
+
+
+def build_title_index(titles):
+    """
+    Calcola l'ordine alfabetico dei titoli.
+
+    Args:
+        titles (Iterable[str]): titoli nell'ordine del file
+
+    Returns:
+        array: posizioni delle righe (uint32) in ordine di titolo
+    """
+    keys = [title_key(title) for title in titles]
+    return array("I", sorted(range(len(keys)), key=keys.__getitem__))
+
+
+def index_path(file_path):
+    return file_path + INDEX_SUFFIX
+
+
+def save_title_index(file_path, order):
+    """
+    Salva l'indice accanto al CSV insieme alla firma del file.
+
+    Args:
+        file_path (str): percorso del CSV
+        order (array): posizioni ordinate restituite da `build_title_index`
+    """
+    header = b"%s %s %d\n" % (_MAGIC, dataset_signature(file_path).encode(), len(order))
+    with open(index_path(file_path), "wb") as index_file:
+        index_file.write(header)
+        order.tofile(index_file)
+
+
+def load_title_index(file_path):
+    """
+    Carica l'indice salvato, se esiste ed è aggiornato rispetto al CSV.
+
+    Args:
+        file_path (str): percorso del CSV
+
+    Returns:
+        array | None: posizioni ordinate, None se l'indice manca o è obsoleto
+    """
+    try:
+        with open(index_path(file_path), "rb") as index_file:
+            magic, signature, count = index_file.readline().split()
+            if magic != _MAGIC or signature.decode() != dataset_signature(file_path):
+                return None
+            order = array("I")
+            order.fromfile(index_file, int(count))
+            return order
+    except (OSError, ValueError, EOFError):
+        return None
+
+
+def sorted_titles(file_path, titles):
+    """
+    Titoli in ordine alfabetico usando l'indice salvato accanto al CSV: se
+    è aggiornato l'ordinamento è una semplice scansione, altrimenti viene
+    costruito dai titoli già letti e salvato per le volte successive (se la
+    cartella del CSV non è scrivibile si usa solo l'ordine in memoria).
+
+    Args:
+        file_path (str): percorso del CSV da cui provengono i titoli
+        titles (Sequence[str]): titoli nell'ordine del file (es.
+            `TitleSortReport.titles`)
+
+    Returns:
+        list[str]: titoli ordinati
+    """
+    order = load_title_index(file_path)
+    if order is None or len(order) != len(titles):
+        order = build_title_index(titles)
+        try:
+            save_title_index(file_path, order)
+        except OSError:
+            pass
+    return [titles[i] for i in order]
@@ -0,0 +1,85 @@
+"""
+Interrogazioni "i migliori K film" senza ordinare l'intero dataset.
+
+Le soluzioni filtrano per rating e poi fanno `sort_values` su tutte le righe
+rimaste (O(n log n)). Qui:
+- sul DataFrame si usa `nlargest`, che seleziona i K valori senza ordinare
+  il resto;
+- sullo streaming si mantiene un heap di dimensione K (O(n log k)) senza
+  mai materializzare le righe scartate.
+"""
+import heapq
+from itertools import count
+
+from .stream import Report
+
+
+def top_rated(frame, k, threshold=None, column="rating"):
+    """
+    I `k` film con rating più alto, opzionalmente sopra una soglia.
+
+    Args:
+        frame (pandas.DataFrame): dataset (es. da `cache.load_movies`)
+        k (int): numero di film da restituire
+        threshold (float | None): soglia esclusiva sul rating
+        column (str): colonna del rating
+
+    Returns:
+        pandas.DataFrame: al più `k` righe, dal rating più alto
+    """
+    if threshold is not None:
+        frame = frame[frame[column] > threshold]
+    return frame.nlargest(k, column)
+
+
+def top_rated_stream(movies, k, threshold=None):
+    """
+    Versione in streaming di `top_rated`.
+
+    Args:
+        movies (Iterable[Movie]): film (es. da `stream.iter_movies`)
+        k (int): numero di film da restituire
+        threshold (float | None): soglia esclusiva sul rating
+
+    Returns:
+        list[Movie]: al più `k` film, dal rating più alto
+    """
+    report = TopRatedReport(k, threshold)
+    for movie in movies:
+        report.feed(movie)
+    return report.result()
+
+
+class TopRatedReport(Report):
+    """
+    Report per il motore in streaming: tiene solo i `k` film migliori in un
+    heap (il minimo in cima, così ogni nuovo film costa O(log k)).
+    """
+
+    def __init__(self, k, threshold=None):
+        if k < 0:
+            raise ValueError(f"k deve essere >= 0, non {k}")
+        self.k = k
+        self.threshold = threshold
+        self.heap = []
+        # a parità di rating vince il film letto prima
+        self._order = count()
+
+    def feed(self, movie):
+        rating = movie.rating
+        if rating is None or (self.threshold is not None and rating <= self.threshold):
+            return
+        entry = (rating, -next(self._order), movie)
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, entry)
+        elif self.heap and entry > self.heap[0]:  # con k=0 l'heap resta vuoto
+            heapq.heapreplace(self.heap, entry)
+
+    def merge(self, other):
+        # i film dell'altro report vengono dopo nel file: a parità di
+        # rating restano dietro a quelli già presenti
+        for movie in other.result():
+            self.feed(movie)
+
+    def result(self):
+        return [movie for _, _, movie in sorted(self.heap, reverse=True)]
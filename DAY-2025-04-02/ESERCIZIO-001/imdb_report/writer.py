@@ -0,0 +1,141 @@
+"""
+Scrittura in parallelo dei file dei report.
+
+Le soluzioni salvano un file alla volta con `to_csv`
+(film_ordine_alfabetico.csv, film_2h+.csv, mpa.csv, rating.csv,
+best_films.csv). Qui tutti i file vengono scritti contemporaneamente da un
+pool di thread a partire da un unico insieme di risultati in memoria, con
+buffer di scrittura grandi e compressione opzionale (gzip, oppure zstd se
+è installato il pacchetto `zstandard`). Compressione e scrittura su disco
+rilasciano il GIL e si sovrappongono tra i thread; la formattazione delle
+righe con `csv.writer` invece tiene il GIL, quindi quella parte non è
+parallela e il guadagno dipende da quanto pesano compressione e I/O.
+
+Esempio:
+    reports = default_reports()
+    run_reports("imdb_movies_2024.csv", reports.values())
+    write_tables(report_tables(reports, "imdb_movies_2024.csv"), "output", compression="gzip")
+"""
+import csv
+import gzip
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .stream import HighRatingReport, LongMovieCount, Movie, MpaTable, TitleSortReport
+from .titles import sorted_titles
+from .topk import TopRatedReport
+
+# buffer di scrittura per file
+BUFFER_SIZE = 1024 * 1024
+
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+# intestazione delle tabelle di film, nell'ordine dei campi di Movie
+_MOVIE_COLUMNS = {"title": "Title", "link": "Movie Link", "year": "Year", "minutes": "Minutes",
+                  "mpa": "MPA", "rating": "Rating", "votes": "Votes"}
+MOVIE_HEADER = tuple(_MOVIE_COLUMNS[field] for field in Movie._fields)
+
+
+def _open_output(file_path, compression, level):
+    if compression is None:
+        return open(file_path, "w", newline="", encoding="utf-8", buffering=BUFFER_SIZE)
+    if compression == "gzip":
+        stream = gzip.open(file_path, "wb", compresslevel=6 if level is None else level)
+        return io.TextIOWrapper(io.BufferedWriter(stream, BUFFER_SIZE), encoding="utf-8", newline="")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("La compressione zstd richiede il pacchetto 'zstandard' (pip install zstandard)") from e
+        raw = open(file_path, "wb")
+        stream = zstandard.ZstdCompressor(level=3 if level is None else level).stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(io.BufferedWriter(stream, BUFFER_SIZE), encoding="utf-8", newline="")
+    raise ValueError(f"Compressione non supportata: {compression}")
+
+
+def write_table(file_path, table, compression=None, level=None):
+    """
+    Scrive una tabella in un file CSV (eventualmente compresso).
+
+    Args:
+        file_path (str): file di destinazione (senza suffisso di compressione)
+        table (pandas.DataFrame | tuple[Sequence[str], Iterable[Sequence]]):
+            DataFrame oppure coppia (intestazione, righe)
+        compression (str | None): None, "gzip" o "zstd"
+        level (int | None): livello di compressione (None: 6 per gzip, 3
+            per zstd; 0 è un livello valido)
+
+    Returns:
+        str: percorso del file scritto
+    """
+    file_path += COMPRESSION_SUFFIXES[compression]
+    with _open_output(file_path, compression, level) as output:
+        if hasattr(table, "to_csv"):
+            table.to_csv(output, index=False)
+        else:
+            header, rows = table
+            writer = csv.writer(output, lineterminator="\n")
+            writer.writerow(header)
+            writer.writerows(rows)
+    return file_path
+
+
+def write_tables(tables, folder=".", compression=None, level=None, workers=None):
+    """
+    Scrive più tabelle contemporaneamente.
+
+    Args:
+        tables (dict[str, table]): nome del file -> tabella (vedi `write_table`)
+        folder (str): cartella di destinazione
+        compression (str | None): None, "gzip" o "zstd"
+        level (int | None): livello di compressione
+        workers (int | None): numero di thread (default: uno per file)
+
+    Returns:
+        list[str]: percorsi dei file scritti
+    """
+    os.makedirs(folder, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers or max(1, len(tables))) as executor:
+        futures = [
+            executor.submit(write_table, os.path.join(folder, name), table, compression, level)
+            for name, table in tables.items()
+        ]
+        return [future.result() for future in futures]
+
+
+def _movie_rows(movies):
+    return (tuple("" if value is None else value for value in movie) for movie in movies)
+
+
+def report_tables(reports, file_path=None):
+    """
+    Converte i report del motore in streaming nelle tabelle da salvare,
+    con i nomi di file usati nelle soluzioni.
+
+    Args:
+        reports (dict[str, Report] | Iterable[Report]): report già eseguiti
+        file_path (str | None): CSV letto dai report; se indicato la lista
+            dei titoli usa l'indice salvato (`titles.sorted_titles`)
+
+    Returns:
+        dict[str, tuple]: nome del file -> (intestazione, righe)
+    """
+    if isinstance(reports, dict):
+        reports = reports.values()
+
+    tables = {}
+    for report in reports:
+        if isinstance(report, TitleSortReport):
+            titles = report.result() if file_path is None else sorted_titles(file_path, report.titles)
+            tables["film_ordine_alfabetico.csv"] = (("Title",), ((title,) for title in titles))
+        elif isinstance(report, LongMovieCount):
+            tables["film_2h+.csv"] = ((f"Film >= {report.min_minutes} minuti",), [(report.result(),)])
+        elif isinstance(report, MpaTable):
+            tables["mpa.csv"] = (("MPA", "Numero di film"), report.result())
+        elif isinstance(report, HighRatingReport):
+            tables["rating.csv"] = (MOVIE_HEADER, _movie_rows(report.result()))
+        elif isinstance(report, TopRatedReport):
+            tables["best_films.csv"] = (MOVIE_HEADER, _movie_rows(report.result()))
+    return tables
+
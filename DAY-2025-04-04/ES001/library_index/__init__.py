@@ -0,0 +1,13 @@
+"""
+library_index: catalogo indicizzato per l'esercizio della biblioteca (traccia.md).
+
+Richiede Python 3.11 o successivo (CPython): il filtro per trigrammi di
+`advanced_search` usa `re._parser` (vedi `trigram.py`); se manca, la ricerca
+resta corretta ma verifica tutti i libri.
+
+Uso (dalla cartella ES001):
+    from library_index import Library
+
+    library = Library.load("Claudio Caudullo/bibliotecaGrande.json")
+"""
+from .catalog import Library
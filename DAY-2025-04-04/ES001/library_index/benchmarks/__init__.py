@@ -0,0 +1,6 @@
+"""
+Benchmark del pacchetto library_index.
+
+Ogni modulo si esegue da solo dalla cartella ES001, ad esempio:
+    python -m library_index.benchmarks.lookup --books 1000000
+"""
@@ -0,0 +1,94 @@
+"""
+Confronto tra l'importazione con `max(...) + 1` a ogni inserimento (come
+`generate_id` nelle soluzioni, O(n²)) e `Library.add_many` (O(n)), più
+una verifica di scalabilità con parole tutte diverse (vocabolario che
+cresce con il catalogo): raddoppiando i libri il tempo deve circa
+raddoppiare.
+
+    python -m library_index.benchmarks.bulk_add --books 1000000 --baseline-books 20000
+"""
+import argparse
+import random
+import string
+import time
+
+from ..catalog import Library
+from .lookup import DEFAULT_SOURCE, scaled_books, timed
+
+
+def generate_id(library):
+    # versione di riferimento (Salvatore Viganò / Mirko Russo)
+    return max((book["id"] for book in library), default=0) + 1
+
+
+def import_with_max(records):
+    library = []
+    for title, author, year in records:
+        library.append({"id": generate_id(library), "title": title, "author": author,
+                        "year": year, "available": True})
+    return library
+
+
+def unique_word_records(books, seed=0):
+    """Libri con titolo e autore formati da parole casuali (quasi tutte distinte)."""
+    rng = random.Random(seed)
+
+    def word():
+        return "".join(rng.choices(string.ascii_lowercase, k=10))
+
+    return [(f"{word()} {word()}", word(), 1800 + i % 225) for i in range(books)]
+
+
+def scaling(books, steps=3, max_ratio=3.0):
+    """
+    Tempo di `add_many` per `books`, 2*`books`, 4*`books`... libri.
+
+    Returns:
+        bool: True se ogni raddoppio costa al più `max_ratio` volte il passo precedente
+    """
+    previous = None
+    linear = True
+    for step in range(steps):
+        records = unique_word_records(books << step, seed=step)
+        start = time.perf_counter()
+        Library().add_many(records)
+        elapsed = time.perf_counter() - start
+        ratio = "" if previous is None else f"  x{elapsed / previous:.2f}"
+        print(f"{len(records):>12,} libri {elapsed:>10.3f} s{ratio}")
+        if previous is not None and elapsed > previous * max_ratio:
+            linear = False
+        previous = elapsed
+    return linear
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--books", type=int, default=1_000_000)
+    parser.add_argument("--baseline-books", type=int, default=20_000,
+                        help="libri importati con max()+1 (quadratico: tenere basso)")
+    parser.add_argument("--source", default=DEFAULT_SOURCE)
+    parser.add_argument("--scaling-books", type=int, default=50_000,
+                        help="primo passo della verifica di scalabilità (0 per saltarla)")
+    args = parser.parse_args(argv)
+
+    records = [(book["title"], book["author"], book["year"]) for book in scaled_books(args.source, args.books)]
+    baseline = records[:args.baseline_books]
+
+    print(f"max() + 1: {len(baseline):,} libri")
+    _, t_max = timed("max() + 1", import_with_max, baseline)
+    _, t_small = timed("Library.add_many", Library().add_many, baseline)
+    print(f"Speedup: {t_max / t_small:.0f}x")
+
+    print(f"\nLibrary.add_many: {len(records):,} libri")
+    library = Library()
+    ids, _ = timed("Library.add_many", library.add_many, records)
+    assert list(ids) == list(range(1, len(records) + 1))
+
+    if args.scaling_books:
+        print("\nScalabilità (parole tutte diverse):")
+        if not scaling(args.scaling_books):
+            raise SystemExit("add_many non scala linearmente")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Confronto tra le operazioni per id con scansione della lista (come nelle
+soluzioni degli studenti) e `Library`, su `Claudio Caudullo/bibliotecaGrande.json`
+replicato fino al numero di libri richiesto.
+
+    python -m library_index.benchmarks.lookup --books 1000000 --ops 200
+"""
+import argparse
+import json
+import os
+import random
+import time
+
+from ..catalog import Library
+
+DEFAULT_SOURCE = os.path.join(os.path.dirname(__file__), "..", "..", "Claudio Caudullo", "bibliotecaGrande.json")
+
+
+def scaled_books(source, books):
+    """
+    Replica i libri del file sorgente fino a `books` elementi, con id univoci.
+
+    Returns:
+        list[dict]: libri
+    """
+    with open(source, encoding="utf-8") as json_file:
+        sample = json.load(json_file)
+    return [dict(sample[i % len(sample)], id=i + 1) for i in range(books)]
+
+
+# versioni di riferimento (Ivan Scandura / Salvatore Viganò)
+def lend_book(library, book_id):
+    for book in library:
+        if book["id"] == book_id:
+            if book["available"]:
+                book["available"] = False
+                return True
+            return False
+    return None
+
+
+def return_book(library, book_id):
+    for book in library:
+        if book["id"] == book_id:
+            if not book["available"]:
+                book["available"] = True
+                return True
+            return False
+    return None
+
+
+def remove_book(library, book_id):
+    for book in library:
+        if book["id"] == book_id:
+            library.remove(book)
+            return book
+    return None
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}{elapsed:>10.3f} s")
+    return result, elapsed
+
+
+def run_ops(lend, give_back, remove, ids):
+    for book_id in ids:
+        lend(book_id)
+        give_back(book_id)
+    for book_id in ids:
+        remove(book_id)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--books", type=int, default=1_000_000)
+    parser.add_argument("--ops", type=int, default=200, help="libri prestati, restituiti e rimossi")
+    parser.add_argument("--source", default=DEFAULT_SOURCE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    books = scaled_books(args.source, args.books)
+    ids = random.Random(args.seed).sample(range(1, args.books + 1), min(args.ops, args.books))
+    print(f"Libri: {args.books:,}  operazioni: {len(ids)} x (presta, restituisci, rimuovi)")
+
+    plain = [dict(book) for book in books]
+    library, t_build = timed("Library (costruzione)", Library, books)
+
+    _, t_scan = timed("lista + scansione", run_ops,
+                      lambda i: lend_book(plain, i), lambda i: return_book(plain, i),
+                      lambda i: remove_book(plain, i), ids)
+    _, t_index = timed("Library", run_ops, library.lend, library.return_book, library.remove, ids)
+
+    assert [book["id"] for book in plain] == [book["id"] for book in library], "i cataloghi non coincidono"
+    print(f"Speedup: {t_scan / t_index:.0f}x (costruzione dell'indice: {t_build:.3f} s)")
+
+
+if __name__ == "__main__":
+    main()
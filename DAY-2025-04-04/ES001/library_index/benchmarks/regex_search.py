@@ -0,0 +1,70 @@
+"""
+Confronto tra la ricerca con espressioni regolari per scansione (come
+`advanced_search` di Ivan Scandura: `pattern.search` su titolo, autore e
+anno di ogni libro) e `Library.advanced_search` con l'indice dei trigrammi.
+
+Oltre ai libri del file sorgente vengono aggiunti alcuni casi limite per
+le maiuscole (es. "İ", "ſ", il segno di kelvin): per ogni espressione i
+risultati devono coincidere con quelli della scansione.
+
+    python -m library_index.benchmarks.regex_search --books 200000
+"""
+import argparse
+import re
+
+from ..catalog import Library
+from .lookup import DEFAULT_SOURCE, scaled_books, timed
+
+# libri i cui campi `re.IGNORECASE` confronta carattere per carattere in
+# modo diverso da `str.casefold` / `str.lower`
+EDGE_BOOKS = (
+    ("Racconti del Bosforo", "İstanbul Yazarları", 1990),
+    ("Il faſcino del passato", "Anonimo", 1750),
+    ("Lo zero assoluto", "Lord Kelvin", 1900),
+    ("ΟΔΟΣΑ", "Σοφία", 2001),
+    ("Straße der Bücher", "Müller", 1985),
+)
+
+PATTERNS = (
+    ("istanbul", re.IGNORECASE),
+    ("fascino", re.IGNORECASE),
+    ("kelvin", re.IGNORECASE),
+    ("ΟΣ", 0),
+    ("traße", 0),
+    ("Harry.*Potter", re.IGNORECASE),
+    ("tolkien|orwell", re.IGNORECASE),
+    (r"18\d{2}", 0),
+    (r"^the\b", re.IGNORECASE),
+)
+
+
+def scan_search(books, regex):
+    # versione di riferimento (Ivan Scandura)
+    return [
+        book for book in books
+        if regex.search(book["title"]) or regex.search(book["author"]) or regex.search(str(book["year"]))
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--books", type=int, default=200_000)
+    parser.add_argument("--source", default=DEFAULT_SOURCE)
+    args = parser.parse_args(argv)
+
+    library = Library(scaled_books(args.source, args.books))
+    library.add_many(EDGE_BOOKS)
+    books = list(library)
+    print(f"Libri: {len(books):,}")
+
+    for pattern, flags in PATTERNS:
+        regex = re.compile(pattern, flags)
+        print(f"\n{pattern!r}")
+        expected, t_scan = timed("scansione", scan_search, books, regex)
+        found, t_index = timed("Library.advanced_search", library.advanced_search, regex)
+        assert found == expected, f"risultati diversi per {pattern!r}"
+        print(f"{len(found):,} libri, speedup: {t_scan / max(t_index, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+Catalogo della biblioteca indicizzato per id.
+
+In tutte le soluzioni (`lend_book` / `return_book` / `remove_book` di Ivan
+Scandura, `borrow_book` di Salvatore Viganò, funzioni.py di Mirko Russo,
+main.py di Giuseppe Ivan Genco) ogni operazione su un libro scorre la lista
+`library` per trovare l'id, e `list.remove` la scorre una seconda volta.
+Qui accanto alla lista ordinata dei libri si tengono:
+- `by_id`: id -> dizionario del libro (ricerca O(1));
+- `positions`: id -> posizione nella lista, così la rimozione lascia un
+  "buco" (None) in O(1) invece di spostare tutti gli elementi successivi.
+  I buchi vengono eliminati in blocco quando diventano la metà della lista
+  (costo ammortizzato O(1)), mantenendo l'ordine del catalogo.
+
+I libri restano dizionari con le chiavi usate nei file JSON delle soluzioni
+(id, title, author, year, available). Il file salvato contiene anche il
+prossimo id da assegnare (vedi `ids.py`); si caricano anche le liste
+semplici delle soluzioni, purché usino queste chiavi e id interi (non i
+file con chiavi italiane, id UUID o la lista dentro "library"/"libri":
+`load` li rifiuta con un ValueError). Titoli e autori sono indicizzati per la ricerca
+per parole (vedi `text_index.py`) e per trigrammi, per la ricerca con
+espressioni regolari (vedi `trigram.py`); gli anni hanno un indice
+ordinato per le ricerche per intervallo (vedi `year_index.py`). L'indice
+dei trigrammi è il più pesante e viene costruito solo alla prima
+`advanced_search`: chi presta, restituisce o rimuove libri non lo paga.
+
+Esempio:
+    library = Library.load("biblioteca.json")
+    book_id = library.add("1984", "George Orwell", 1949)
+    library.lend(book_id)
+    library.return_book(book_id)
+    library.search("orwell")
+    library.books_between(1800, 1899)
+    library.remove(book_id)
+    library.save("biblioteca.json")
+"""
+import json
+import re
+
+from .ids import IdAllocator
+from .text_index import TokenIndex
+from .trigram import TrigramIndex
+from .year_index import YearIndex, as_year
+
+# campi su cui lavora advanced_search
+SEARCH_FIELDS = ("title", "author", "year")
+
+# chiavi obbligatorie di ogni libro
+BOOK_KEYS = frozenset(("id", "title", "author", "year", "available"))
+
+
+def _checked(book):
+    """Copia di un libro letto da file o passato al costruttore, con le chiavi controllate."""
+    if not isinstance(book, dict):
+        raise ValueError(f"Libro non valido (atteso un dizionario): {book!r}")
+    missing = BOOK_KEYS - book.keys()
+    if missing:
+        raise ValueError(f"Chiavi mancanti {sorted(missing)} nel libro {book!r}")
+    return dict(book)
+
+
+class Library:
+    """Libri in ordine di inserimento con accesso e rimozione per id in O(1)."""
+
+    def __init__(self, books=(), next_id=1):
+        # catalogo ordinato; None al posto dei libri rimossi
+        self.books = []
+        self.by_id = {}
+        self.positions = {}
+        self.removed = 0
+        self.ids = IdAllocator(next_id)
+        self.words = TokenIndex()
+        # indice dei trigrammi, costruito alla prima advanced_search
+        self._grams = None
+        self.years = YearIndex()
+        for book in books:
+            self._insert(_checked(book))
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        Carica la biblioteca da un file JSON: `{"next_id": ..., "books": [...]}`
+        oppure una semplice lista di libri (il prossimo id è allora il
+        massimo + 1). Ogni libro deve avere le chiavi di BOOK_KEYS e un id
+        intero.
+
+        Args:
+            file_path (str): percorso del file
+
+        Returns:
+            Library: biblioteca indicizzata
+
+        Raises:
+            ValueError: se il file non ha questo formato
+        """
+        with open(file_path, encoding="utf-8") as json_file:
+            data = json.load(json_file)
+        if isinstance(data, list):
+            return cls(data)
+        if not isinstance(data, dict) or not isinstance(data.get("books"), list):
+            found = sorted(data) if isinstance(data, dict) else type(data).__name__
+            raise ValueError(
+                f"Formato non supportato in {file_path}: attesa una lista di libri "
+                f"o {{\"next_id\": ..., \"books\": [...]}}, trovato {found}"
+            )
+        return cls(data["books"], data.get("next_id", 1))
+
+    def save(self, file_path):
+        """Salva il prossimo id e i libri, nell'ordine del catalogo, in un file JSON."""
+        with open(file_path, "w", encoding="utf-8") as json_file:
+            json.dump({"next_id": self.ids.next_id, "books": list(self)}, json_file,
+                      indent=4, ensure_ascii=False)
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __iter__(self):
+        return (book for book in self.books if book is not None)
+
+    def __contains__(self, book_id):
+        return book_id in self.by_id
+
+    # --- operazioni interne ----------------------------------------------
+
+    def _insert(self, book):
+        book_id = book["id"]
+        if book_id in self.by_id:
+            raise ValueError(f"Id duplicato: {book_id}")
+        # controlli prima di modificare il catalogo o gli indici
+        book["year"] = as_year(book["year"])
+        self.ids.observe(book_id)
+        self.positions[book_id] = len(self.books)
+        self.books.append(book)
+        self.by_id[book_id] = book
+        self.words.add(book_id, book["title"], book["author"])
+        if self._grams is not None:
+            self._grams.add(book_id, book["title"], book["author"])
+        self.years.add(book_id, book["year"])
+        return book
+
+    def _compact(self):
+        """Elimina i buchi lasciati dalle rimozioni e ricalcola le posizioni."""
+        self.books = [book for book in self.books if book is not None]
+        self.positions = {book["id"]: i for i, book in enumerate(self.books)}
+        self.removed = 0
+
+    def grams(self):
+        """Indice dei trigrammi, costruito alla prima richiesta e poi aggiornato."""
+        if self._grams is None:
+            grams = TrigramIndex()
+            for book in self:
+                grams.add(book["id"], book["title"], book["author"])
+            self._grams = grams
+        return self._grams
+
+    # --- operazioni sui libri --------------------------------------------
+
+    def get(self, book_id):
+        """
+        Restituisce il libro con l'id indicato.
+
+        Raises:
+            KeyError: se l'id non esiste
+        """
+        try:
+            return self.by_id[book_id]
+        except KeyError:
+            raise KeyError(f"Libro con id {book_id} non trovato") from None
+
+    def add(self, title, author, year, available=True):
+        """
+        Aggiunge un libro con un nuovo id.
+
+        Returns:
+            int: id assegnato
+
+        Raises:
+            ValueError: se l'anno non è un numero intero (nessun id viene consumato)
+        """
+        year = as_year(year)
+        book = {"id": self.ids.allocate(), "title": title, "author": author, "year": year, "available": available}
+        return self._insert(book)["id"]
+
+    def add_many(self, books):
+        """
+        Aggiunge più libri in blocco riservando un intervallo di id in O(1):
+        l'importazione di n libri costa O(n).
+
+        Args:
+            books (Iterable[dict | tuple]): libri senza id, come dizionari
+                (title, author, year, available opzionale) o tuple
+                (title, author, year)
+
+        Returns:
+            range: id assegnati, nell'ordine dei libri
+
+        Raises:
+            ValueError: se un anno non è un numero intero (nessun libro viene
+                aggiunto)
+        """
+        books = list(books)
+        years = [as_year(book["year"] if isinstance(book, dict) else book[2]) for book in books]
+        ids = self.ids.allocate_range(len(books))
+        for book_id, book, year in zip(ids, books, years):
+            if isinstance(book, dict):
+                book = {"available": True, **book, "id": book_id}
+                book["year"] = year
+            else:
+                title, author, _ = book
+                book = {"id": book_id, "title": title, "author": author, "year": year, "available": True}
+            self._insert(book)
+        return ids
+
+    def remove(self, book_id):
+        """
+        Rimuove un libro dato il suo id.
+
+        Returns:
+            dict: libro rimosso
+
+        Raises:
+            KeyError: se l'id non esiste
+        """
+        book = self.get(book_id)
+        del self.by_id[book_id]
+        self.books[self.positions.pop(book_id)] = None
+        self.words.remove(book_id, book["title"], book["author"])
+        if self._grams is not None:
+            self._grams.remove(book_id, book["title"], book["author"])
+        self.years.remove(book_id, book["year"])
+        self.removed += 1
+        if self.removed * 2 > len(self.books):
+            self._compact()
+        return book
+
+    def lend(self, book_id):
+        """
+        Segna un libro come in prestito.
+
+        Returns:
+            bool: False se il libro era già in prestito
+
+        Raises:
+            KeyError: se l'id non esiste
+        """
+        book = self.get(book_id)
+        if not book["available"]:
+            return False
+        book["available"] = False
+        return True
+
+    def return_book(self, book_id):
+        """
+        Segna un libro come disponibile.
+
+        Returns:
+            bool: False se il libro non era in prestito
+
+        Raises:
+            KeyError: se l'id non esiste
+        """
+        book = self.get(book_id)
+        if book["available"]:
+            return False
+        book["available"] = True
+        return True
+
+    def search(self, keyword, prefix=True):
+        """
+        Cerca i libri per parole del titolo o dell'autore, senza distinguere
+        maiuscole e accenti, usando l'indice invertito.
+
+        Args:
+            keyword (str): una o più parole (tutte devono comparire)
+            prefix (bool): le parole valgono anche come inizio di parola
+
+        Returns:
+            list[dict]: libri trovati, nell'ordine del catalogo
+        """
+        ids = sorted(self.words.search(keyword, prefix), key=self.positions.__getitem__)
+        return [self.by_id[book_id] for book_id in ids]
+
+    def books_between(self, start, end):
+        """
+        Libri pubblicati tra `start` e `end` (inclusi), in O(log n + k).
+
+        Returns:
+            list[dict]: libri trovati, in ordine di anno
+        """
+        return [self.by_id[book_id] for book_id in self.years.between(start, end)]
+
+    def advanced_search(self, pattern, flags=re.IGNORECASE, fields=SEARCH_FIELDS):
+        """
+        Cerca con un'espressione regolare in titolo, autore e anno.
+
+        Sull'anno la regex viene valutata una volta per anno distinto
+        (indice degli anni); su titolo e autore solo per i candidati
+        dell'indice dei trigrammi (costruito alla prima chiamata). Per un
+        intervallo di anni noto (es. i libri dell'Ottocento, `18\\d{2}`)
+        `books_between` è più diretto.
+
+        Args:
+            pattern (str | re.Pattern): espressione regolare
+            flags (int): flag di `re.compile` (ignorati se `pattern` è già
+                compilato)
+            fields (Iterable[str]): campi in cui cercare, tra SEARCH_FIELDS
+
+        Returns:
+            list[dict]: libri trovati, nell'ordine del catalogo
+        """
+        regex = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, flags)
+        fields = set(fields)
+        if not fields <= set(SEARCH_FIELDS):
+            raise ValueError(f"Campi non supportati: {sorted(fields - set(SEARCH_FIELDS))}")
+
+        found = set(self.years.matching(regex)) if "year" in fields else set()
+        text_fields = [field for field in ("title", "author") if field in fields]
+        if text_fields:
+            found.update(
+                book_id for book_id in self.grams().candidates(regex)
+                if book_id not in found
+                and any(regex.search(self.by_id[book_id][field]) for field in text_fields)
+            )
+        return [self.by_id[book_id] for book_id in sorted(found, key=self.positions.__getitem__)]
+
+    def available(self):
+        """Libri disponibili, nell'ordine del catalogo."""
+        return [book for book in self if book["available"]]
+
+    def on_loan(self):
+        """Libri in prestito, nell'ordine del catalogo."""
+        return [book for book in self if not book["available"]]
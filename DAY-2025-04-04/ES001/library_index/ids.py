@@ -0,0 +1,49 @@
+"""
+Assegnazione degli id dei libri in O(1).
+
+`generate_id` / `generate_new_id` / `aggiungi_libro` delle soluzioni
+calcolano `max(book["id"] for book in library) + 1` a ogni inserimento:
+importare n libri costa O(n²), e dopo la cancellazione dell'ultimo libro il
+suo id viene riassegnato. Qui il prossimo id è un contatore che cresce
+soltanto; viene salvato nell'intestazione del file della biblioteca
+(`{"next_id": ..., "books": [...]}`), quindi anche dopo un riavvio gli id
+dei libri cancellati non vengono riusati.
+"""
+
+
+class IdAllocator:
+    """Contatore monotono degli id; `allocate_range` riserva blocchi contigui."""
+
+    def __init__(self, next_id=1):
+        self.next_id = next_id
+
+    def allocate(self):
+        """Restituisce un nuovo id."""
+        book_id = self.next_id
+        self.next_id += 1
+        return book_id
+
+    def allocate_range(self, count):
+        """
+        Riserva `count` id consecutivi in O(1).
+
+        Returns:
+            range: id riservati
+        """
+        if count < 0:
+            raise ValueError("count deve essere >= 0")
+        ids = range(self.next_id, self.next_id + count)
+        self.next_id += count
+        return ids
+
+    def observe(self, book_id):
+        """
+        Registra un id già esistente (caricato da file), senza mai tornare indietro.
+
+        Raises:
+            ValueError: se l'id non è un intero (es. gli UUID di alcune soluzioni)
+        """
+        if not isinstance(book_id, int) or isinstance(book_id, bool):
+            raise ValueError(f"Id non supportato: {book_id!r} (gli id devono essere interi)")
+        if book_id >= self.next_id:
+            self.next_id = book_id + 1
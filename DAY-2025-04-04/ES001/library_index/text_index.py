@@ -0,0 +1,130 @@
+"""
+Indice invertito delle parole di titolo e autore.
+
+`search_book` nelle soluzioni converte in minuscolo titolo e autore di ogni
+libro (e la parola chiave, per ogni libro, nella versione di Ivan Scandura)
+e fa un controllo di sottostringa: ogni ricerca è O(n). Qui le parole
+vengono normalizzate una volta sola (casefold e rimozione degli accenti,
+"Città" -> "citta") e indicizzate:
+- `postings`: parola -> insieme degli id dei libri che la contengono;
+- `vocabulary()`: parole distinte in ordine, per le ricerche per prefisso
+  con `bisect` ("orw" -> "orwell"). Non viene aggiornata a ogni
+  inserimento (`insort` costerebbe O(parole distinte) per ogni parola
+  nuova, quindi O(V²) per costruire l'indice): le parole nuove si
+  accodano e la lista ordinata si ricostruisce alla prima ricerca per
+  prefisso con un solo `sorted`.
+
+Una ricerca costa in base al numero di parole corrispondenti e di libri
+trovati, non alla dimensione del catalogo. L'indice si aggiorna a ogni
+aggiunta e rimozione.
+"""
+import re
+import unicodedata
+from bisect import bisect_left
+
+_WORD = re.compile(r"\w+")
+
+
+def fold(text):
+    """
+    Normalizza un testo per la ricerca: casefold e senza accenti.
+
+    Args:
+        text (str): testo originale (es. "Città")
+
+    Returns:
+        str: testo normalizzato (es. "citta")
+    """
+    text = text.casefold()
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text):
+    """Parole normalizzate di un testo."""
+    return _WORD.findall(fold(text))
+
+
+class TokenIndex:
+    """Indice parola -> id dei libri, con ricerca esatta e per prefisso."""
+
+    def __init__(self):
+        self.postings = {}
+        # parole ordinate all'ultima ricostruzione, parole nuove da allora e
+        # numero di parole rimosse (ancora presenti in _sorted)
+        self._sorted = []
+        self._pending = []
+        self._stale = 0
+
+    def add(self, book_id, *texts):
+        """Indicizza i testi (titolo, autore, ...) di un libro."""
+        for token in {token for text in texts for token in tokenize(str(text))}:
+            ids = self.postings.get(token)
+            if ids is None:
+                ids = self.postings[token] = set()
+                self._pending.append(token)
+            ids.add(book_id)
+
+    def remove(self, book_id, *texts):
+        """Toglie dall'indice i testi di un libro (gli stessi passati ad `add`)."""
+        for token in {token for text in texts for token in tokenize(str(text))}:
+            ids = self.postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(book_id)
+            if not ids:
+                del self.postings[token]
+                self._stale += 1
+
+    def vocabulary(self):
+        """
+        Parole distinte in ordine alfabetico, ricostruite solo se l'indice è
+        cambiato dall'ultima chiamata.
+
+        Returns:
+            list[str]: vocabolario ordinato
+        """
+        if self._stale:
+            self._sorted = sorted(self.postings)
+        elif self._pending:
+            # due sequenze già ordinate: timsort le fonde in tempo lineare
+            self._pending.sort()
+            self._sorted = sorted(self._sorted + self._pending)
+        self._pending = []
+        self._stale = 0
+        return self._sorted
+
+    def _matching(self, token, prefix):
+        if not prefix:
+            return self.postings.get(token, set())
+        vocabulary = self.vocabulary()
+        start = bisect_left(vocabulary, token)
+        end = bisect_left(vocabulary, token + "\U0010ffff", start)
+        if end - start == 1:
+            return self.postings[vocabulary[start]]
+        return set().union(*(self.postings[word] for word in vocabulary[start:end]))
+
+    def search(self, query, prefix=True):
+        """
+        Id dei libri che contengono tutte le parole della ricerca.
+
+        Args:
+            query (str): una o più parole
+            prefix (bool): le parole della ricerca valgono anche come inizio
+                di parola ("orw" trova "Orwell")
+
+        Returns:
+            set: id trovati (vuoto se la ricerca non contiene parole)
+        """
+        # prima le parole più selettive: l'intersezione resta piccola
+        matches = sorted((self._matching(token, prefix) for token in set(tokenize(query))), key=len)
+        if not matches:
+            return set()
+        result = set(matches[0])
+        for ids in matches[1:]:
+            result &= ids
+            if not result:
+                break
+        return result
@@ -0,0 +1,196 @@
+"""
+Indice dei trigrammi per la ricerca con espressioni regolari.
+
+`advanced_search`, `ricerca_avanzata`, `regex_search` e `filtroPerRegex`
+delle soluzioni eseguono `pattern.search` su titolo e autore di ogni libro.
+Qui ogni libro è indicizzato per i trigrammi (sequenze di 3 caratteri,
+in minuscolo carattere per carattere, vedi `fold`) dei suoi campi; per una
+ricerca:
+1. dall'espressione regolare si ricavano i letterali che ogni
+   corrispondenza deve contenere (es. `Harry.*Potter` -> "harry",
+   "potter"; con le alternative `a|b` si ottiene un OR di gruppi);
+2. i trigrammi dei letterali restringono i candidati intersecando gli
+   insiemi di id;
+3. l'espressione completa viene eseguita solo sui candidati.
+
+Se l'espressione non contiene letterali di almeno 3 caratteri (es. `\\d+`)
+non c'è filtro e si verificano tutti i libri.
+
+I letterali si ricavano con il parser interno di `re` (`re._parser`, non
+documentato), presente da Python 3.11 in CPython: è la versione supportata.
+Con altre versioni, o se il parser non riesce ad analizzare l'espressione,
+`candidates` restituisce tutti i libri (ricerca corretta ma senza filtro).
+"""
+import re
+
+try:
+    from re import _parser
+except ImportError:  # Python < 3.11 o implementazioni diverse da CPython
+    _parser = None
+
+# oltre questo numero di alternative si rinuncia a filtrare il ramo
+MAX_ALTERNATIVES = 32
+
+# caratteri non ASCII che con `re.IGNORECASE` corrispondono a una lettera ASCII
+_ASCII_EQUIVALENTS = {"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"}
+
+
+class _FoldTable(dict):
+    """
+    Tabella per `str.translate`: minuscola di ogni singolo carattere, come
+    la confronta `re` (`casefold` invece trasforma "İ" in due caratteri e
+    `lower` dipende dal contesto per il sigma finale).
+    """
+
+    def __missing__(self, code):
+        char = chr(code)
+        lower = char.lower()
+        folded = self[code] = lower if len(lower) == 1 else char
+        return folded
+
+
+_FOLD = _FoldTable({ord(char): ascii_char for char, ascii_char in _ASCII_EQUIVALENTS.items()})
+
+
+def fold(text):
+    """Normalizza maiuscole e minuscole un carattere alla volta (stessa lunghezza del testo)."""
+    if text.isascii():
+        return text.lower()
+    return text.translate(_FOLD)
+
+
+def trigrams(text):
+    """Insieme dei trigrammi (dopo `fold`) di un testo."""
+    text = fold(text)
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _combine(left, right):
+    """AND di due espressioni in forma "OR di gruppi di letterali"."""
+    if len(left) * len(right) > MAX_ALTERNATIVES:
+        return left
+    return [a + b for a in left for b in right]
+
+
+def _required(items, ignore_case):
+    """
+    Letterali richiesti da una sequenza di elementi analizzati da `re`.
+    Senza distinzione di maiuscole si usano solo i caratteri ASCII: per gli
+    altri `re` ammette corrispondenze che `fold` non riproduce.
+
+    Returns:
+        list[list[str]]: alternative, ognuna con i letterali che devono
+        comparire tutti ([[]] = nessun vincolo)
+    """
+    result = [[]]
+    run = []
+
+    def flush():
+        nonlocal result
+        if run:
+            literal = "".join(run)
+            result = [group + [literal] for group in result]
+            run.clear()
+
+    for op, value in items:
+        if op is _parser.LITERAL and not (ignore_case and value > 127):
+            run.append(chr(value))
+            continue
+        if op is _parser.AT:
+            # ancore (^, $, \b): non consumano caratteri
+            continue
+        flush()
+        if op is _parser.SUBPATTERN:
+            result = _combine(result, _required(value[-1], ignore_case))
+        elif op in (_parser.MAX_REPEAT, _parser.MIN_REPEAT):
+            low, _, item = value
+            if low >= 1:
+                result = _combine(result, _required(item, ignore_case))
+        elif op is _parser.BRANCH:
+            alternatives = [group for branch in value[1] for group in _required(branch, ignore_case)]
+            result = _combine(result, alternatives)
+    flush()
+    return result
+
+
+def required_literals(pattern, flags=0):
+    """
+    Letterali che ogni corrispondenza dell'espressione deve contenere.
+
+    Args:
+        pattern (str | re.Pattern): espressione regolare
+        flags (int): flag di `re` (ignorati se `pattern` è già compilato)
+
+    Returns:
+        list[list[str]]: OR di gruppi di letterali (dopo `fold`); [[]]
+        se l'espressione non si può analizzare (nessun vincolo)
+    """
+    if isinstance(pattern, re.Pattern):
+        pattern, flags = pattern.pattern, pattern.flags
+    if _parser is None:
+        return [[]]
+    try:
+        parsed = _parser.parse(pattern, flags)
+        ignore_case = bool(parsed.state.flags & re.IGNORECASE)
+        groups = _required(parsed, ignore_case)
+    except Exception:
+        # API interna cambiata o espressione non analizzabile: nessun filtro
+        return [[]]
+    return [[fold(literal) for literal in group] for group in groups]
+
+
+class TrigramIndex:
+    """Indice trigramma -> id dei libri, con ricerca per espressione regolare."""
+
+    def __init__(self):
+        self.postings = {}
+        self.ids = set()
+
+    @staticmethod
+    def _grams(texts):
+        # campi separati da "\n": nessun trigramma a cavallo di due campi
+        return trigrams("\n".join(str(text) for text in texts))
+
+    def add(self, book_id, *texts):
+        """Indicizza i campi (titolo, autore, anno, ...) di un libro."""
+        self.ids.add(book_id)
+        for gram in self._grams(texts):
+            self.postings.setdefault(gram, set()).add(book_id)
+
+    def remove(self, book_id, *texts):
+        """Toglie dall'indice i campi di un libro (gli stessi passati ad `add`)."""
+        self.ids.discard(book_id)
+        for gram in self._grams(texts):
+            ids = self.postings.get(gram)
+            if ids is not None:
+                ids.discard(book_id)
+                if not ids:
+                    del self.postings[gram]
+
+    def _group_candidates(self, literals):
+        grams = {gram for literal in literals for gram in trigrams(literal)}
+        if not grams:
+            return None
+        sets = sorted((self.postings.get(gram, set()) for gram in grams), key=len)
+        result = set(sets[0])
+        for ids in sets[1:]:
+            result &= ids
+            if not result:
+                break
+        return result
+
+    def candidates(self, pattern):
+        """
+        Id dei libri che possono corrispondere all'espressione (superinsieme
+        dei risultati: l'espressione va comunque verificata).
+
+        Returns:
+            set: id candidati (tutti i libri se non c'è un filtro utilizzabile)
+        """
+        result = set()
+        for group in required_literals(pattern):
+            ids = self._group_candidates(group)
+            if ids is None:
+                return set(self.ids)
+            result |= ids
+        return result
@@ -0,0 +1,76 @@
+"""
+Indice ordinato degli anni di pubblicazione.
+
+`advanced_search` di Ivan Scandura trova i libri dell'Ottocento eseguendo
+la regex `18\\d{2}` su `str(book["year"])` (oltre che su titolo e autore)
+per ogni libro. Qui gli anni distinti sono tenuti in una lista ordinata
+(`bisect`) e ogni anno ha i propri id nell'ordine di inserimento:
+- `books_between(start, end)` costa O(log n + k): due ricerche binarie e
+  poi solo i libri restituiti;
+- una regex sull'anno si valuta una volta per anno distinto (poche
+  centinaia), non una volta per libro.
+"""
+from bisect import bisect_left, bisect_right, insort
+
+
+def as_year(year):
+    """
+    Anno come intero (accetta anche il testo letto con `input()`, es. "1965").
+
+    Raises:
+        ValueError: se l'anno non è un numero intero
+    """
+    try:
+        return int(year)
+    except (TypeError, ValueError):
+        raise ValueError(f"Anno non valido: {year!r}") from None
+
+
+class YearIndex:
+    """Anno -> id dei libri, con anni distinti ordinati per le ricerche per intervallo."""
+
+    def __init__(self):
+        # anno -> {id: None}: insieme ordinato per inserimento, rimozione O(1)
+        self.by_year = {}
+        self.years = []
+
+    def add(self, book_id, year):
+        ids = self.by_year.get(year)
+        if ids is None:
+            ids = self.by_year[year] = {}
+            insort(self.years, year)
+        ids[book_id] = None
+
+    def remove(self, book_id, year):
+        ids = self.by_year.get(year)
+        if ids is None:
+            return
+        ids.pop(book_id, None)
+        if not ids:
+            del self.by_year[year]
+            del self.years[bisect_left(self.years, year)]
+
+    def between(self, start, end):
+        """
+        Id dei libri con anno compreso tra `start` e `end` (inclusi), in
+        ordine di anno e, a parità di anno, di inserimento.
+
+        Returns:
+            list: id trovati
+        """
+        first = bisect_left(self.years, start)
+        last = bisect_right(self.years, end)
+        return [book_id for year in self.years[first:last] for book_id in self.by_year[year]]
+
+    def matching(self, regex):
+        """
+        Id dei libri il cui anno (come testo) soddisfa l'espressione
+        regolare, valutata una volta per anno distinto.
+
+        Returns:
+            list: id trovati, in ordine di anno
+        """
+        return [
+            book_id for year in self.years if regex.search(str(year))
+            for book_id in self.by_year[year]
+        ]